@@ -2,15 +2,11 @@
 import sys
 import os
 import re
-import argparse
-import textwrap
 import json
-import shutil
+import copy
 import time
-import subprocess
-import tty
-import termios
-from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
 
 # ==========================================
 # CONFIGURATION & CONSTANTS
@@ -37,8 +33,16 @@ if BASE_DIR not in sys.path:
 JAAVIS_HOME = os.path.join(HOME, ".jaavis")
 EXTERNAL_LIB_PATH = os.path.join(JAAVIS_HOME, "library")
 BUNDLED_LIB_PATH = os.path.join(BASE_DIR, "library")
+SKILL_INDEX_PATH = os.path.join(JAAVIS_HOME, "skill_index.json")
+SEARCH_CACHE_PATH = os.path.join(JAAVIS_HOME, "search_cache.json")
+SKILL_META_PATH = os.path.join(JAAVIS_HOME, "skill_meta.json")
+HELP_CACHE_PATH = os.path.join(JAAVIS_HOME, "help_cache.json")
+UPDATES_PENDING_PATH = os.path.join(JAAVIS_HOME, ".updates_pending") # exists while the core library is behind origin
 
+@lru_cache(maxsize=1)
 def get_default_library_path():
+    """Default (programmer) library. Resolved on first use, since it may copy the bundled library."""
+    import shutil
     # 1. Env Var
     if os.environ.get("JAAVIS_LIBRARY_PATH"):
         return os.environ.get("JAAVIS_LIBRARY_PATH")
@@ -60,33 +64,121 @@ def get_default_library_path():
     # 3. Always return the external path as the source of truth
     return EXTERNAL_LIB_PATH
 
-DEFAULT_LIBRARY_PATH = get_default_library_path()
-TEMPLATE_PATH = os.path.join(DEFAULT_LIBRARY_PATH, "templates/skill.md")
+def _template_path():
+    return os.path.join(get_default_library_path(), "templates/skill.md")
+
 LOGO_PATH = os.path.join(BASE_DIR, "logo.md")
 
-# ANSI Colors
-CYAN = '\033[1;36m'
-GREEN = '\033[1;32m'
-YELLOW = '\033[1;33m'
-MAGENTA = '\033[1;35m'
-BLUE = '\033[1;34m'
-WHITE = '\033[1;37m'
-RED = '\033[1;31m'
-BOLD = '\033[1m'
-RESET = '\033[0m'
-GREY = '\033[0;90m'
+# DEFAULT_LIBRARY_PATH / TEMPLATE_PATH used to be computed at import; keep them readable as
+# module attributes (PEP 562) without triggering the library migration on every startup
+_LAZY_ATTRS = {"DEFAULT_LIBRARY_PATH": get_default_library_path, "TEMPLATE_PATH": _template_path}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return _LAZY_ATTRS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# ANSI Colors (empty when output is piped or NO_COLOR is set, so logs/grep get plain text)
+_COLOR = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+CYAN = '\033[1;36m' if _COLOR else ''
+GREEN = '\033[1;32m' if _COLOR else ''
+YELLOW = '\033[1;33m' if _COLOR else ''
+MAGENTA = '\033[1;35m' if _COLOR else ''
+BLUE = '\033[1;34m' if _COLOR else ''
+WHITE = '\033[1;37m' if _COLOR else ''
+RED = '\033[1;31m' if _COLOR else ''
+BOLD = '\033[1m' if _COLOR else ''
+RESET = '\033[0m' if _COLOR else ''
+GREY = '\033[0;90m' if _COLOR else ''
+CLEAR_SCREEN = '\033[H\033[2J'
+
+# Precompiled Patterns
+_RE_NAME_NORMALIZE = re.compile(r'[^a-z0-9_]')       # persona names
+_RE_LIST_PREFIX = re.compile(r'^\d+\.\s*|-\s*')      # workflow list bullets
+_RE_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_RE_ITAL = re.compile(r'\*(.*?)\*')
+_RE_FM_SCALAR = re.compile(r'(name|description|grade):[ \t]+(.+?)[ \t]*')  # flat skill frontmatter
+_RE_FM_LIST = re.compile(r'(tags|pros|cons):[ \t]*\[(.*)\][ \t]*')
+_EXEC_BLOCK_RE = re.compile(r'<!--\s*JAAVIS:EXEC\s*-->\s*```bash\n(.*?)\n```', re.DOTALL)  # executable skill blocks
+_SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9_-]')                  # harvested deploy filenames
+_MD_CODE_RE = re.compile(r'```[^\n]*\n(.*?)```', re.DOTALL)      # first fenced block (language line skipped)
+_REMOTE_PREFIX_RE = re.compile(r'^(?:https://|git@)')               # menu remote labels
+_SHELL_META_RE = re.compile(r'[|&;<>(){}$`*?\[\]~=#!\n\\]')       # commands that need a real shell
+
+# Executable lookup (PATH scans are cached for the life of the process)
+@lru_cache(maxsize=8)
+def _which(name):
+    import shutil
+    return shutil.which(name)
+
+@lru_cache(maxsize=1)
+def _default_editor():
+    """$EDITOR, falling back to 'open'. Read once per process."""
+    return os.environ.get('EDITOR', 'open')
+
+# Shared rich console: rich is imported on first use, not at startup
+@lru_cache(maxsize=1)
+def _get_console():
+    from rich.console import Console
+    return Console()
+
+@lru_cache(maxsize=1)
+def _get_rich():
+    """The rich pieces the formatted commands use, imported once on first use."""
+    from types import SimpleNamespace
+    from rich import box
+    from rich.columns import Columns
+    from rich.console import Group
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich.table import Table
+    from rich.text import Text
+    return SimpleNamespace(box=box, Columns=Columns, escape=escape, Group=Group, Panel=Panel,
+                           Prompt=Prompt, Table=Table, Text=Text)
+
+@lru_cache(maxsize=1)
+def _get_yaml():
+    """PyYAML module, or None when it isn't installed (so the failed import isn't retried per file)."""
+    try:
+        import yaml
+        return yaml
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=1)
+def _get_orjson():
+    """orjson module when installed (faster .jaavisrc parse/serialize), else None."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
 
 # ==========================================
 # CONFIGURATION MANAGEMENT
 # ==========================================
+# Parsed ~/.jaavis_config.json, keyed by file mtime (refreshed by save_config)
+_CONFIG_CACHE = {"mtime": None, "data": None}
+
 def load_config():
-    if os.path.exists(CONFIG_PATH):
+    """Returns the global config. Parsed once per invocation and reused while the file is unchanged."""
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return {}
+
+    if _CONFIG_CACHE["mtime"] != mtime:
         try:
             with open(CONFIG_PATH, 'r') as f:
-                return json.load(f)
-        except:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
              return {}
-    return {}
+        _CONFIG_CACHE["mtime"] = mtime
+        _CONFIG_CACHE["data"] = data
+
+    # Callers mutate the returned dict before saving, so hand out a private copy
+    return copy.deepcopy(_CONFIG_CACHE["data"])
 
 def save_config(data):
     # Secure Save: Ensure file is read/write by owner only (0o600)
@@ -98,8 +190,35 @@ def save_config(data):
             json.dump(data, f, indent=2)
         # Force permissions for existing files
         os.chmod(CONFIG_PATH, 0o600)
+
+        # Keep the in-memory copy in sync so the next load_config() skips the disk
+        _CONFIG_CACHE["mtime"] = os.stat(CONFIG_PATH).st_mtime_ns
+        _CONFIG_CACHE["data"] = copy.deepcopy(data)
     except Exception as e:
         print(f"{RED}Error saving config: {e}{RESET}")
+    finally:
+        # Persona/library may have changed
+        get_active_library_path.cache_clear()
+        get_current_persona_name.cache_clear()
+
+# Config edits queued by mark_config_dirty(), written once by flush_config()
+_CONFIG_PENDING = {"data": None, "dirty": False, "atexit": False}
+
+def mark_config_dirty(config):
+    """Queues config to be saved later, so a burst of edits costs a single write."""
+    if not _CONFIG_PENDING["atexit"]:
+        import atexit
+        atexit.register(flush_config) # Safety net if the session ends without a flush
+        _CONFIG_PENDING["atexit"] = True
+    _CONFIG_PENDING["data"] = config
+    _CONFIG_PENDING["dirty"] = True
+
+def flush_config():
+    """Saves the queued config, if any edit is pending."""
+    if not _CONFIG_PENDING["dirty"]:
+        return
+    _CONFIG_PENDING["dirty"] = False
+    save_config(_CONFIG_PENDING["data"])
 
 def get_api_key(provider):
     """Retrieves API Key with priority: 1. Environment Var, 2. Config File"""
@@ -122,55 +241,137 @@ def get_api_key(provider):
     return config.get('env', {}).get(key_name)
 
 
-def get_git_status(path):
-    """Returns (last_sync_time, pending_count) tuple"""
-    if not os.path.exists(os.path.join(path, ".git")):
+def get_git_status(path, known_repo=False):
+    """Returns (last_sync_time, pending_count) tuple. known_repo skips the .git probe when the caller just did it."""
+    import subprocess
+    if not known_repo and not os.path.exists(os.path.join(path, ".git")):
         return None, 0
 
     try:
-        # Get uncommitted changes count
-        pending = subprocess.check_output(f"git -C {path} status --porcelain | wc -l", shell=True).decode().strip()
-        pending = int(pending) if pending else 0
+        # Get uncommitted changes count (one porcelain line per entry; no shell or wc needed)
+        # --no-optional-locks: a read-only probe shouldn't rewrite the index (or bump its mtime)
+        status = subprocess.run(["git", "--no-optional-locks", "-C", path, "status", "--porcelain"],
+                                capture_output=True, text=True)
+        pending = status.stdout.count("\n")
 
         # Get last commit relative time
-        last_sync = subprocess.check_output(f"git -C {path} log -1 --format='%cr'", shell=True).decode().strip()
-
-        return last_sync, pending
-    except:
-        return None, 0
+        log = subprocess.run(["git", "-C", path, "log", "-1", "--format=%cr"], capture_output=True, text=True)
+    except OSError:
+        return None, 0 # git not installed
+    if log.returncode:
+        return None, 0 # e.g. no commits yet
+    return log.stdout.rstrip("\n"), pending
+
+GIT_STATUS_TTL = 5 # seconds a menu may show a git status before refreshing it in the background
+_GIT_STATUS_CACHE = {} # path -> (checked_at, stamp, (last_sync, pending))
+
+def _refresh_git_status(path, stamp):
+    _GIT_STATUS_CACHE[path] = (time.monotonic(), stamp, get_git_status(path, known_repo=True))
+
+def _worktree_stamp(path):
+    """mtimes of the library root and its top-level folders (skills/, scripts/...), without running git.
+    They move when a file is added, removed or renamed directly inside one of them."""
+    try:
+        with os.scandir(path) as it:
+            stamps = [(e.name, e.stat().st_mtime_ns) for e in it
+                      if e.name != ".git" and e.is_dir(follow_symlinks=False)]
+        stamps.append((".", os.stat(path).st_mtime_ns))
+    except OSError:
+        return None
+    return tuple(stamps)
+
+def _git_status_for_menu(path):
+    """get_git_status() for menu labels. Waits for git on first sight, after .git/index changed, or
+    when _worktree_stamp() moved; an answer older than GIT_STATUS_TTL is shown as-is while a
+    background thread refreshes it. Edits inside existing files (or deeper folders) move none of
+    those stamps, so the pending count can lag by one redraw.
+    Sync/push decisions still call get_git_status() for the live state."""
+    import threading
+    git_dir = os.path.join(path, ".git")
+    try:
+        git_mtime = os.stat(git_dir).st_mtime_ns
+    except OSError:
+        return None, 0 # Not a repo
+    try:
+        index_mtime = os.stat(os.path.join(git_dir, "index")).st_mtime_ns
+    except OSError:
+        return get_git_status(path, known_repo=True) # Nothing staged yet
+    stamp = (git_mtime, index_mtime, _worktree_stamp(path))
+
+    cached = _GIT_STATUS_CACHE.get(path)
+    if cached is None or cached[1] != stamp:
+        _refresh_git_status(path, stamp)
+    elif time.monotonic() - cached[0] > GIT_STATUS_TTL:
+        # Re-stamp first so repeated renders don't pile up refresh threads
+        _GIT_STATUS_CACHE[path] = (time.monotonic(), stamp, cached[2])
+        threading.Thread(target=_refresh_git_status, args=(path, stamp), daemon=True).start()
+    return _GIT_STATUS_CACHE[path][2]
 
 def open_brain_vscode():
     """Opens the entire Jaavis Brain (~/.jaavis) in VS Code"""
+    import subprocess
     if not os.path.exists(JAAVIS_HOME):
         os.makedirs(JAAVIS_HOME, exist_ok=True)
 
     print(f"📂 Opening JAAVIS Brain at {JAAVIS_HOME}...")
 
     # Try VS Code first
-    if shutil.which('code'):
+    if _which('code'):
         subprocess.call(['code', JAAVIS_HOME])
     elif sys.platform == 'darwin':
         subprocess.call(['open', JAAVIS_HOME])
     else:
         print(f"{RED}VS Code ('code') not found in PATH.{RESET}")
 
+def _current_branch(repo_path):
+    """Checked-out branch, read from .git/HEAD without forking git. None when detached/unreadable."""
+    try:
+        with open(os.path.join(repo_path, ".git", "HEAD"), 'r') as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    return head[len("ref: refs/heads/"):] if head.startswith("ref: refs/heads/") else None
+
+def _dynamic_persona_keys(personas):
+    """User-created personas (everything but the built-in programmer), alphabetically."""
+    return sorted(k for k in personas if k != "programmer")
+
+def _ordered_persona_keys(personas):
+    """Programmer first, the rest alphabetically (the order every persona menu uses)."""
+    return ["programmer"] + _dynamic_persona_keys(personas)
+
+@lru_cache(maxsize=128)
+def _shorten_remote(remote, width=25):
+    """Remote URL without its scheme/user prefix, cut to width (with "...") for menu labels."""
+    short = _REMOTE_PREFIX_RE.sub("", remote)
+    return short[:width] + "..." if len(short) > width else short
+
+def _repo_state(path):
+    """'git' for a git-linked folder, 'dir' for a plain one, None if missing. One stat in the usual case."""
+    try:
+        os.stat(os.path.join(path, ".git"))
+        return "git"
+    except OSError:
+        return "dir" if os.path.exists(path) else None
+
 def sync_all_personas():
     """Smart Sync: Pulls updates or Clones missing brains. Interactive & Robust."""
+    import subprocess
     config = load_config()
     personas = config.get("personas", {})
-    if "programmer" not in personas: personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+    if "programmer" not in personas: personas["programmer"] = {"path": get_default_library_path()}
 
     # 1. Build Menu Options
-    persona_keys = ["programmer"] + sorted([k for k in personas.keys() if k != "programmer"])
+    persona_keys = _ordered_persona_keys(personas)
     menu_options = ["Sync All (Default)"]
 
     for p in persona_keys:
         p_data = personas.get(p, {})
         path = p_data.get("path")
         remote = p_data.get("remote_url", "No Remote")
-        short_remote = remote.replace("https://", "").replace("git@", "")[:25] + "..." if len(remote) > 25 else remote
+        short_remote = _shorten_remote(remote)
 
-        last_sync, pending = get_git_status(path)
+        last_sync, pending = _git_status_for_menu(path)
         status_icon = "✅" if pending == 0 else "⚠️ Dirty"
 
         menu_options.append(f"{p.capitalize()} [{short_remote}] {status_icon}")
@@ -195,10 +396,11 @@ def sync_all_personas():
 
         print(f"  {CYAN}• {name.capitalize()}:{RESET} ", end="", flush=True)
 
-        if os.path.exists(path):
-            if os.path.exists(os.path.join(path, ".git")):
-                # Check for dirty state
-                _, pending = get_git_status(path)
+        state = _repo_state(path)
+        if state:
+            if state == "git":
+                # Check for dirty state (.git was just probed by _repo_state)
+                _, pending = get_git_status(path, known_repo=True)
 
                 # Logic: Stash -> Pull (Rebase) -> Pop
                 commands = []
@@ -218,10 +420,8 @@ def sync_all_personas():
                     if res.returncode != 0:
                         # Fallback: If pull failed, maybe upstream isn't set?
                         if "pull" in cmd and "no tracking information" in res.stderr:
-                             try:
-                                 current_branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path).decode().strip()
-                             except:
-                                 current_branch = "main"
+                             rev = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path, capture_output=True, text=True)
+                             current_branch = rev.stdout.rstrip("\n") if rev.returncode == 0 else "main"
 
                              print(f"{YELLOW} Setting upstream to origin/{current_branch}...{RESET}")
                              subprocess.run(["git", "branch", "--set-upstream-to", f"origin/{current_branch}", current_branch], cwd=path, capture_output=True)
@@ -292,21 +492,23 @@ def sync_all_personas():
 
 def push_all_personas():
     """Iterates through all personas and pushes changes. Interactive."""
+    import subprocess
+    from datetime import datetime
     config = load_config()
     personas = config.get("personas", {})
-    if "programmer" not in personas: personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+    if "programmer" not in personas: personas["programmer"] = {"path": get_default_library_path()}
 
     # 1. Build Menu Options
-    persona_keys = ["programmer"] + sorted([k for k in personas.keys() if k != "programmer"])
+    persona_keys = _ordered_persona_keys(personas)
     menu_options = ["Push All (Default)"]
 
     for p in persona_keys:
         p_data = personas.get(p, {})
         path = p_data.get("path")
         remote = p_data.get("remote_url", "No Remote")
-        short_remote = remote.replace("https://", "").replace("git@", "")[:20] + "..." if len(remote) > 20 else remote
+        short_remote = _shorten_remote(remote, 20)
 
-        last_sync, pending = get_git_status(path)
+        last_sync, pending = _git_status_for_menu(path)
         status = f"[{pending} pending]" if pending > 0 else "Clean"
 
         menu_options.append(f"{p.capitalize()} [{short_remote}] {status}")
@@ -327,31 +529,27 @@ def push_all_personas():
         p_data = personas.get(name, {})
         path = p_data.get("path")
 
-        if not path or not os.path.exists(path): continue
+        state = _repo_state(path) if path else None
+        if not state: continue
 
         print(f"  {CYAN}• {name.capitalize()}:{RESET} ", end="", flush=True)
 
         # Check for Git
-        if not os.path.exists(os.path.join(path, ".git")):
+        if state != "git":
              print(f"{YELLOW} Not a git repo.{RESET}")
              if input(f"    {CYAN}? Initialize Git? (y/N): {RESET}").strip().lower() == 'y':
                  try:
                      subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
                      subprocess.run(["git", "branch", "-M", "main"], cwd=path, check=True, capture_output=True)
                      print(f"    {GREEN}Initialized.{RESET}")
-                 except:
+                 except (OSError, subprocess.CalledProcessError):
                      print(f"    {RED}Failed.{RESET}")
                      continue
              else:
                  continue
 
         # Check Remote
-        has_remote = False
-        try:
-            res = subprocess.run(["git", "remote"], cwd=path, capture_output=True, text=True)
-            if "origin" in res.stdout:
-                has_remote = True
-        except: pass
+        has_remote = _has_origin_remote(path)
 
         if not has_remote:
             print(f"{YELLOW} No remote configured.{RESET}")
@@ -364,19 +562,22 @@ def push_all_personas():
                         personas[name]["remote_url"] = url
                         config_changed = True
                         has_remote = True
-                    except:
+                    except (OSError, subprocess.CalledProcessError):
                         print(f"    {RED}Failed to add remote.{RESET}")
 
         if has_remote:
             try:
-                # Add
+                # Branch read once from .git/HEAD; main/master are only guessed when it's detached
+                branch = _current_branch(path)
+
+                # Add (keeps new, untracked skills; `commit -a` would miss them)
                 subprocess.run(["git", "add", "."], cwd=path, check=True, capture_output=True)
-                # Commit (ignore empty)
-                subprocess.run(["git", "commit", "-m", f"Brain Sync: {datetime.now()}"], cwd=path, capture_output=True)
+                # Commit (ignore empty); hooks are skipped for these automatic snapshots
+                subprocess.run(["git", "commit", "--no-verify", "-m", f"Brain Sync: {datetime.now()}"], cwd=path, capture_output=True)
 
                 # Pull (Rebase) - Sync with remote before pushing
                 print(f"    {GREY}Syncing (Rebase)...{RESET}", end="", flush=True)
-                pull_res = subprocess.run(["git", "pull", "origin", "main", "--rebase"], cwd=path, capture_output=True, text=True)
+                pull_res = subprocess.run(["git", "pull", "origin", branch or "main", "--rebase"], cwd=path, capture_output=True, text=True)
 
                 if pull_res.returncode != 0:
                      # Check if it was just "no upstream"
@@ -386,19 +587,20 @@ def push_all_personas():
                          print(f"\n    {YELLOW}Pull/Rebase encountered issues. Trying to push anyway (might fail)...{RESET}")
 
                 # Push
-                res = subprocess.run(["git", "push", "origin", "main"], cwd=path, capture_output=True, text=True)
-                if res.returncode != 0:
-                     # Try master fallback
-                     res = subprocess.run(["git", "push", "origin", "master"], cwd=path, capture_output=True, text=True)
+                for push_branch in ([branch] if branch else ["main", "master"]):
+                    res = subprocess.run(["git", "push", "origin", push_branch], cwd=path, capture_output=True, text=True)
+                    if res.returncode == 0:
+                        break
 
                 if res.returncode == 0:
                     print(f"{GREEN}Synced ✔{RESET}")
                     # Update config if remote wasn't there
                     if "remote_url" not in personas[name]:
                         # Get URL
-                        url = subprocess.check_output(["git", "remote", "get-url", "origin"], cwd=path).decode().strip()
-                        personas[name]["remote_url"] = url
-                        config_changed = True
+                        url_res = subprocess.run(["git", "remote", "get-url", "origin"], cwd=path, capture_output=True, text=True)
+                        if url_res.returncode == 0:
+                            personas[name]["remote_url"] = url_res.stdout.rstrip("\n")
+                            config_changed = True
                 else:
                     print(f"{RED}Push Failed.{RESET}")
                     # Prompt to Change Remote?
@@ -480,29 +682,29 @@ def call_llm_api(provider, system_prompt, user_content):
 
 def brainstorm_skill(target_path, provider="local"):
     """Executes the brainstorming session."""
+    import shutil
+    import subprocess
 
     # 1. Read Target Context
     if not os.path.exists(target_path):
         print(f"{RED}Error: Target {target_path} not found.{RESET}")
         return
 
-    with open(target_path, 'r') as f:
-        content = f.read()
-
     # 2. Prepare Prompt
     system_prompt = get_brainstorm_prompt()
-    full_request = f"{system_prompt}\n\n--- TARGET CONTEXT ---\n{content}"
 
     # 3. Execute
     if provider == "local":
+        # Prompt header, then the target streamed in chunks (never held in memory whole)
         out_file = target_path + ".prompt.txt"
-        with open(out_file, 'w') as f:
-            f.write(full_request)
+        with open(out_file, 'w') as out, open(target_path, 'r') as src:
+            out.write(f"{system_prompt}\n\n--- TARGET CONTEXT ---\n")
+            shutil.copyfileobj(src, out, 65536)
         print(f"\n{GREEN}📝 Brainstorm Context generated:{RESET} {out_file}")
         print(f"{GREY}Copy this content into Gemini/ChatGPT/DeepSeek to get your refactor.{RESET}")
 
         # Auto-open
-        if shutil.which('code'):
+        if _which('code'):
             subprocess.call(['code', out_file])
         elif sys.platform == 'darwin':
             subprocess.call(['open', out_file])
@@ -513,12 +715,16 @@ def brainstorm_skill(target_path, provider="local"):
         print(f"{RED}API Integration not yet fully hydrated. Switching to Local Dump.{RESET}")
         brainstorm_skill(target_path, "local")
 
+# File types offered as brainstorm targets
+BRAINSTORM_EXTENSIONS = ('.md', '.py', '.sh')
+
 def run_brainstorm_wizard():
     """Interactive Wizard for Jaavis Brainstorm."""
     print(f"\n{MAGENTA}🧠 Jaavis Brainstorm (AI Refactor){RESET}")
 
     # 1. Select Target (Simple: Current Directory's files)
-    files = [f for f in os.listdir('.') if f.endswith('.md') or f.endswith('.py') or f.endswith('.sh')]
+    with os.scandir('.') as it:
+        files = [e.name for e in it if e.name.endswith(BRAINSTORM_EXTENSIONS) and e.is_file()]
     if not files:
         print(f"{RED}No suitable files found in current directory.{RESET}")
         return
@@ -552,68 +758,120 @@ def run_brainstorm_wizard():
     # 4. Execute
     brainstorm_skill(target_file, selected_provider)
 
-def get_key():
+# Decided once: menus fall back to numbered input when stdin is a pipe/CI
+_IS_TTY = sys.stdin.isatty()
 
-    """Captures a single keypress, handling arrow key escape sequences."""
-    fd = sys.stdin.fileno()
+@contextmanager
+def _raw_mode(fd):
+    """Puts the terminal in raw mode for a whole menu session and restores it on exit."""
+    import termios
+    import tty
     old_settings = termios.tcgetattr(fd)
     try:
-        tty.setraw(sys.stdin.fileno())
-        ch = sys.stdin.read(1)
-        if ch == '\x1b':
-            ch += sys.stdin.read(2)
+        tty.setraw(fd)
+        # Keep output post-processing so "\n" still returns the carriage while drawing
+        raw_settings = termios.tcgetattr(fd)
+        raw_settings[1] = old_settings[1]
+        termios.tcsetattr(fd, termios.TCSANOW, raw_settings)
+        yield
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
-    if ch == '\x03': raise KeyboardInterrupt
-    return ch
+ESC_SEQUENCE_TIMEOUT = 0.05 # seconds to wait for the rest of an arrow-key sequence after ESC
 
-def interactive_menu(prompt, options, default_index=0, return_char=False):
-    """Renders an interactive menu handling arrow keys. Supports shortcuts."""
-    current_row = default_index
+def get_key():
+    """Captures a single keypress (inside _raw_mode), handling arrow key escape sequences.
+    A bare ESC is returned as-is instead of blocking until two more bytes arrive."""
+    import select
+    fd = sys.stdin.fileno()
+    ch = os.read(fd, 1)
+    if ch == b'\x1b' and select.select([fd], [], [], ESC_SEQUENCE_TIMEOUT)[0]:
+        ch += os.read(fd, 2)
 
-    while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
-        print(f"\n{CYAN}{prompt}{RESET}")
-        print("-----------------------------------------------------")
+    if ch == b'\x03': raise KeyboardInterrupt
+    return ch.decode(errors='replace')
 
-        for idx, option in enumerate(options):
-            if idx == current_row:
-                print(f"{GREEN}> {option}{RESET}")
-            else:
-                print(f"  {option}")
+def _line_menu(prompt, options, default_index=0, return_char=False):
+    """Numbered, line-based menu used when stdin is not a terminal."""
+    print(f"\n{CYAN}{prompt}{RESET}")
+    for idx, option in enumerate(options, 1):
+        print(f"  [{idx}] {option}")
+
+    answer = input(f"{CYAN}Select [{default_index + 1}]: {RESET}").strip()
+    if return_char and answer.lower() in ['c', 'p', 's']:
+        return (default_index, answer.lower())
 
-        print("-----------------------------------------------------")
-        print(f"{GREY}Use UP/DOWN arrows to navigate, ENTER to select.{RESET}")
-        if return_char:
-             print(f"{GREY}[C] Code | [S] Sync All | [P] Push Brain{RESET}")
+    try:
+        choice = int(answer) - 1 if answer else default_index
+    except ValueError:
+        choice = default_index
+    if not 0 <= choice < len(options):
+        choice = default_index
 
-        key = get_key()
+    return (choice, None) if return_char else choice
 
-        if key == '\x1b[A': # UP
-            if current_row > 0:
-                current_row -= 1
-        elif key == '\x1b[B': # DOWN
-            if current_row < len(options) - 1:
-                current_row += 1
-        elif key == '\r': # ENTER
-            return (current_row, None) if return_char else current_row
+def interactive_menu(prompt, options, default_index=0, return_char=False):
+    """Renders an interactive menu handling arrow keys. Supports shortcuts."""
+    if not _IS_TTY:
+        return _line_menu(prompt, options, default_index, return_char)
 
-        # Handle Shortcuts
-        if return_char and key.lower() in ['c', 'p', 's']:
-            return (current_row, key.lower())
+    current_row = default_index
 
+    # Options are static while the menu is open: format both row variants once
+    selected_rows = [f"{GREEN}> {option}{RESET}" for option in options]
+    plain_rows = [f"  {option}" for option in options]
+
+    # So are the lines around them
+    divider = "-----------------------------------------------------"
+    header = [f"{CLEAR_SCREEN}\n{CYAN}{prompt}{RESET}", divider]
+    footer = [divider, f"{GREY}Use UP/DOWN arrows to navigate, ENTER to select.{RESET}"]
+    if return_char:
+        footer.append(f"{GREY}[C] Code | [S] Sync All | [P] Push Brain{RESET}")
+
+    prev_row = None  # Row shown by the last frame; None forces the first draw
+
+    with _raw_mode(sys.stdin.fileno()):
+        while True:
+            # Only redraw when the selection moved (edge presses and unmapped keys are no-ops)
+            if current_row != prev_row:
+                prev_row = current_row
+
+                # Build the whole frame first and emit it with a single write; it starts by
+                # homing the cursor and clearing the screen (no `clear` process per keypress)
+                frame = (header + plain_rows[:current_row] + selected_rows[current_row:current_row + 1]
+                         + plain_rows[current_row + 1:] + footer)
+
+                sys.stdout.write("\n".join(frame) + "\n")
+                sys.stdout.flush()
+
+            key = get_key()
+
+            if key == '\x1b[A': # UP
+                if current_row > 0:
+                    current_row -= 1
+            elif key == '\x1b[B': # DOWN
+                if current_row < len(options) - 1:
+                    current_row += 1
+            elif key == '\r': # ENTER
+                return (current_row, None) if return_char else current_row
+
+            # Handle Shortcuts
+            if return_char and key.lower() in ['c', 'p', 's']:
+                return (current_row, key.lower())
+
+@lru_cache(maxsize=1)
 def get_active_library_path():
     config = load_config()
     current_persona = config.get("current_persona", "programmer")
     personas = config.get("personas", {})
 
     if current_persona in personas:
-        return personas[current_persona].get("path", DEFAULT_LIBRARY_PATH)
+        return personas[current_persona].get("path", get_default_library_path())
 
     # Default to Programmer/Default path
-    return DEFAULT_LIBRARY_PATH
+    return get_default_library_path()
 
+@lru_cache(maxsize=1)
 def get_current_persona_name():
     config = load_config()
     return config.get("current_persona", "programmer").capitalize()
@@ -621,15 +879,25 @@ def get_current_persona_name():
 # ==========================================
 # PERSONA LOGIC
 # ==========================================
+_LOGO_CACHE = {"data": None} # raw logo.md bytes, read once per process
+
 def load_face():
     """Loads and displays the Jaavis Face (logo.md)"""
-    if os.path.exists(LOGO_PATH):
-        print(CYAN)
-        with open(LOGO_PATH, 'r') as f:
-            print(f.read())
-        print(RESET)
-    else:
-        print(f"{CYAN}🤖 JAAVIS{RESET}")
+    logo = _LOGO_CACHE["data"]
+    if logo is None:
+        try:
+            with open(LOGO_PATH, 'rb') as f:
+                logo = _LOGO_CACHE["data"] = f.read()
+        except OSError:
+            print(f"{CYAN}🤖 JAAVIS{RESET}")
+            return
+
+    # Bytes go straight to the buffer, no decode/encode round-trip
+    sys.stdout.write(CYAN + "\n")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(logo + b"\n")
+    sys.stdout.buffer.flush()
+    sys.stdout.write(RESET + "\n")
 
 def show_welcome():
     """Display onboarding message for new users"""
@@ -644,99 +912,100 @@ def show_welcome():
     print(f"  5. {CYAN}jaavis sync{RESET}       → Update your skill library from critical missions")
     print(f"  6. {CYAN}jaavis help{RESET}       → Show this help message")
 
+def _ensure_defaults(config):
+    """Makes sure config has a personas dict with the built-in programmer entry. Returns that dict."""
+    personas = config.setdefault("personas", {})
+    if "programmer" not in personas:
+        personas["programmer"] = {"path": get_default_library_path()}
+    return personas
+
 def select_persona():
     """Interactive Persona Selection & Configuration"""
+    from concurrent.futures import ThreadPoolExecutor
     load_face()
 
-    config = load_config()
-    current = config.get("current_persona", "programmer")
-
     print(f"{WHITE}Hi I'm Jaavis, your personal assistant.{RESET}\n")
     print(f"{GREY}Current Brain: {JAAVIS_HOME}{RESET}\n")
 
-    # 1. Build Options with Status
-    # Ensure defaults exist in config
-    if "personas" not in config: config["personas"] = {}
-    if "programmer" not in config["personas"]: config["personas"]["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+    config = load_config()
+    # Loops back here after Manage Personas instead of recursing
+    while True:
+        current = config.get("current_persona", "programmer")
 
-    persona_keys = ["programmer"] + sorted([k for k in config["personas"].keys() if k != "programmer"])
-    menu_options = []
+        # 1. Build Options with Status
+        personas = _ensure_defaults(config)
 
-    for p in persona_keys:
-        p_data = config["personas"].get(p, {})
-        p_path = p_data.get("path", DEFAULT_LIBRARY_PATH)
-        lock_status = " 🔒" if p_data.get("locked") else ""
+        persona_keys = _ordered_persona_keys(personas)
+        menu_options = []
 
-        # Get Git Status
-        last_sync, pending = get_git_status(p_path)
+        # Get Git Status for every persona at once: wall time is the slowest repo, not the sum
+        default_path = get_default_library_path()
+        p_paths = [personas[p].get("path", default_path) for p in persona_keys]
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(p_paths)))) as pool:
+            statuses = list(pool.map(_git_status_for_menu, p_paths))
 
-        display_name = p.capitalize()
-        if p == "programmer": display_name += " (One-Army Protocol)"
+        for p, (last_sync, pending) in zip(persona_keys, statuses):
+            p_data = personas[p]
+            lock_status = " 🔒" if p_data.get("locked") else ""
 
-        option_str = f"{display_name}{lock_status}"
-        if last_sync:
-             status_icon = "✅" if pending == 0 else "🛠️"
-             option_str += f"\n    ↳ {GREY}Last Sync: {last_sync} | Pending: {pending} {status_icon}{RESET}"
+            display_name = p.capitalize()
+            if p == "programmer": display_name += " (One-Army Protocol)"
 
-        menu_options.append(option_str)
+            option_str = f"{display_name}{lock_status}"
+            if last_sync:
+                 status_icon = "✅" if pending == 0 else "🛠️"
+                 option_str += f"\n    ↳ {GREY}Last Sync: {last_sync} | Pending: {pending} {status_icon}{RESET}"
 
-    # 2. Add Shortcuts
-    menu_options.append("Manage Personas")
+            menu_options.append(option_str)
 
-    # 3. Determine Default Index
-    default_idx = 0
-    if current in persona_keys:
-        default_idx = persona_keys.index(current)
+        # 2. Add Shortcuts
+        menu_options.append("Manage Personas")
 
-    # 4. Show Interactive Menu with Shortcuts Handler
-    prompt_text = f"Who is operating right now? (Current: {current.upper()})"
+        # 3. Determine Default Index
+        default_idx = 0
+        if current in persona_keys:
+            default_idx = persona_keys.index(current)
 
-    # Custom loop to handle shortcuts 'C' and 'P'
-    while True:
-        choice_idx, char_code = interactive_menu(prompt_text, menu_options, default_index=default_idx, return_char=True)
-
-        if char_code in ['c', 'C']:
-             open_brain_vscode()
-             continue # Refresh menu
-        elif char_code in ['p', 'P']:
-             push_all_personas()
-             input("Press Enter to continue...")
-             continue # Refresh menu
-        else:
-             break # Selection made
+        # 4. Show Interactive Menu with Shortcuts Handler
+        prompt_text = f"Who is operating right now? (Current: {current.upper()})"
 
-    # 5. Map Choice to Persona
-    manage_index = len(menu_options) - 1
+        # Custom loop to handle shortcuts 'C' and 'P'
+        while True:
+            choice_idx, char_code = interactive_menu(prompt_text, menu_options, default_index=default_idx, return_char=True)
 
-    if choice_idx == manage_index:
-        manage_personas_menu()
-        return select_persona()
+            if char_code in ['c', 'C']:
+                 open_brain_vscode()
+                 continue # Refresh menu
+            elif char_code in ['p', 'P']:
+                 push_all_personas()
+                 input("Press Enter to continue...")
+                 continue # Refresh menu
+            else:
+                 break # Selection made
+
+        # 5. Map Choice to Persona
+        manage_index = len(menu_options) - 1
+
+        if choice_idx == manage_index:
+            manage_personas_menu()
+            config = load_config() # Management may have changed it on disk
+            continue
+        break
 
     persona_key = persona_keys[choice_idx]
-    lib_path = config["personas"].get(persona_key, {}).get("path", DEFAULT_LIBRARY_PATH)
+    lib_path = personas[persona_key].get("path", get_default_library_path())
 
-    # Ensure directory exists
-    if not os.path.exists(lib_path):
+    # Ensure directory exists (makedirs creates lib_path itself on the way)
+    if not os.path.isdir(lib_path):
         try:
-            os.makedirs(os.path.join(lib_path, "skills"))
-            os.makedirs(os.path.join(lib_path, "scripts"))
+            os.makedirs(os.path.join(lib_path, "skills"), exist_ok=True)
+            os.makedirs(os.path.join(lib_path, "scripts"), exist_ok=True)
             print(f"{GREEN}✔ Created new memory bank for {persona_key}{RESET}")
-        except:
-            pass
+        except OSError as e:
+            print(f"{RED}Could not create memory bank at {lib_path}: {e}{RESET}")
 
-    # Save Config
+    # Save Config (defaults were already ensured above)
     config["current_persona"] = persona_key
-
-    # Update personas dict
-    if "personas" not in config: config["personas"] = {}
-
-    # Default personas ensure they exist in config
-    if "programmer" not in config["personas"]: config["personas"]["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
-
-    # Save the selected one if not exists
-    if persona_key not in config["personas"]:
-        config["personas"][persona_key] = {"path": lib_path}
-
     save_config(config)
 
     print(f"{YELLOW}User identified: {persona_key.upper()}{RESET}")
@@ -746,37 +1015,44 @@ def select_persona():
 
 def manage_personas_menu():
     """Menu to manage (Rename, Lock, Delete) personas"""
-    while True:
-        options = [
-            "➕ Create New Persona",
-            "✏️  Rename Persona",
-            "🔒 Lock/Unlock Persona",
-            "🗑️  Delete Persona",
-            "⬅️  Back"
-        ]
-
-        choice_idx = interactive_menu("🛠️  Persona Management", options)
-
-        if choice_idx == 0:
-            add_persona()
-        elif choice_idx == 1:
-            rename_persona()
-        elif choice_idx == 2:
-            lock_persona()
-        elif choice_idx == 3:
-            delete_persona()
-        elif choice_idx == 4:
-            break
+    # One config shared by every action in this session; each action updates it in place and
+    # queues it, and it is written once when the menu closes
+    config = load_config()
+    try:
+        while True:
+            options = [
+                "➕ Create New Persona",
+                "✏️  Rename Persona",
+                "🔒 Lock/Unlock Persona",
+                "🗑️  Delete Persona",
+                "⬅️  Back"
+            ]
+
+            choice_idx = interactive_menu("🛠️  Persona Management", options)
+
+            if choice_idx == 0:
+                add_persona(config)
+            elif choice_idx == 1:
+                rename_persona(config)
+            elif choice_idx == 2:
+                lock_persona(config)
+            elif choice_idx == 3:
+                delete_persona(config)
+            elif choice_idx == 4:
+                break
+    finally:
+        flush_config()
 
-def add_persona():
+def add_persona(config=None):
+    from datetime import datetime
     print(f"\n{MAGENTA}➕ Create New Persona{RESET}")
     name = input(f"{CYAN}? Persona Name (give it any name): {RESET}").strip().lower()
     if not name: return
 
     # Normalize
-    name = re.sub(r'[^a-z0-9_]', '', name)
+    name = _RE_NAME_NORMALIZE.sub('', name)
 
-    config = load_config()
+    if config is None: config = load_config()
     if "personas" not in config: config["personas"] = {}
 
     if name in config["personas"] or name == "programmer":
@@ -788,11 +1064,9 @@ def add_persona():
     # FIX: Use Persistent Home instead of BASE_DIR
     lib_path = os.path.join(JAAVIS_HOME, lib_dir)
 
-    if not os.path.exists(lib_path):
-        os.makedirs(lib_path, exist_ok=True)
-        # Create subfolders
-        os.makedirs(os.path.join(lib_path, "skills"), exist_ok=True)
-        os.makedirs(os.path.join(lib_path, "scripts"), exist_ok=True)
+    # Create subfolders (and lib_path with them)
+    os.makedirs(os.path.join(lib_path, "skills"), exist_ok=True)
+    os.makedirs(os.path.join(lib_path, "scripts"), exist_ok=True)
 
     config["personas"][name] = {
         "path": lib_path,
@@ -800,12 +1074,13 @@ def add_persona():
         "locked": False
     }
 
-    save_config(config)
+    mark_config_dirty(config)
     print(f"{GREEN}✔ Persona '{name}' added at {lib_path}!{RESET}")
     time.sleep(1)
 
 def migrate_persona_libraries():
     """Auto-migrates persona libraries from Cellar (volatile) to ~/.jaavis (persistent)"""
+    import shutil
     config = load_config()
     if "personas" not in config: return
 
@@ -830,18 +1105,17 @@ def migrate_persona_libraries():
                 if os.path.exists(old_path):
                     if not os.path.exists(new_path):
                         try:
-                            shutil.copytree(old_path, new_path)
+                            # A rename on the same filesystem; copy + remove across devices
+                            shutil.move(old_path, new_path)
                             print(f"{GREEN}✔ Data moved to {new_path}{RESET}")
                         except Exception as e:
                             print(f"{RED}Failed to move data: {e}{RESET}")
-                            continue # Don't update config if copy failed
+                            continue # Don't update config if move failed
                     else:
                          print(f"{GREY}Target {new_path} already exists. Updating config pointer.{RESET}")
                 else:
                     print(f"{RED}⚠️  Warning: '{name}' library path was lost/missing. Pointing to new location.{RESET}")
-                    if not os.path.exists(new_path):
-                        os.makedirs(new_path, exist_ok=True)
-                        os.makedirs(os.path.join(new_path, "skills"), exist_ok=True)
+                    os.makedirs(os.path.join(new_path, "skills"), exist_ok=True)
 
                 persona['path'] = new_path
                 migrated = True
@@ -851,9 +1125,9 @@ def migrate_persona_libraries():
         print(f"{GREEN}✔ Migration complete. All personas secured in {JAAVIS_HOME}{RESET}\n")
 
 
-def rename_persona():
-    config = load_config()
-    dynamic_personas = sorted([k for k in config.get("personas", {}).keys() if k != "programmer"])
+def rename_persona(config=None):
+    if config is None: config = load_config()
+    dynamic_personas = _dynamic_persona_keys(config.get("personas", {}))
 
     if not dynamic_personas:
         print(f"{YELLOW}No dynamic personas to rename.{RESET}")
@@ -882,7 +1156,7 @@ def rename_persona():
 
     new_name = input(f"{CYAN}? New Name for '{old_name}': {RESET}").strip().lower()
     if not new_name: return
-    new_name = re.sub(r'[^a-z0-9_]', '', new_name)
+    new_name = _RE_NAME_NORMALIZE.sub('', new_name)
 
     if new_name in config["personas"] or new_name == "programmer":
         print(f"{RED}Error: Name '{new_name}' already exists.{RESET}")
@@ -915,14 +1189,14 @@ def rename_persona():
         # Custom path? Just rename key, don't move folder
         config["personas"][new_name] = config["personas"].pop(old_name)
 
-    save_config(config)
+    mark_config_dirty(config)
     print(f"{GREEN}✔ Persona renamed to '{new_name}'!{RESET}")
     time.sleep(1)
 
 
-def lock_persona():
-    config = load_config()
-    dynamic_personas = sorted([k for k in config.get("personas", {}).keys() if k != "programmer"])
+def lock_persona(config=None):
+    if config is None: config = load_config()
+    dynamic_personas = _dynamic_persona_keys(config.get("personas", {}))
 
     if not dynamic_personas:
         print(f"{YELLOW}No dynamic personas to lock/unlock.{RESET}")
@@ -946,14 +1220,15 @@ def lock_persona():
     is_locked = config["personas"][p_name].get("locked", False)
     config["personas"][p_name]["locked"] = not is_locked
 
-    save_config(config)
+    mark_config_dirty(config)
     new_status = "Locked" if not is_locked else "Unlocked"
     print(f"{GREEN}✔ Persona '{p_name}' is now {new_status}.{RESET}")
     time.sleep(1)
 
-def delete_persona():
-    config = load_config()
-    dynamic_personas = sorted([k for k in config.get("personas", {}).keys() if k != "programmer"])
+def delete_persona(config=None):
+    import shutil
+    if config is None: config = load_config()
+    dynamic_personas = _dynamic_persona_keys(config.get("personas", {}))
 
     if not dynamic_personas:
         print(f"{YELLOW}No dynamic personas to delete.{RESET}")
@@ -997,7 +1272,7 @@ def delete_persona():
         if config.get("current_persona") == p_name:
             config["current_persona"] = "programmer"
 
-        save_config(config)
+        mark_config_dirty(config)
         print(f"{GREEN}✔ Persona '{p_name}' deleted successfully.{RESET}")
     else:
         print(f"{YELLOW}Deletion aborted. Confirmation name didn't match.{RESET}")
@@ -1007,90 +1282,224 @@ def delete_persona():
 # ==========================================
 # RENDERER LOGIC (From jaavis_renderer.py)
 # ==========================================
+def _hard_wrap(text, width):
+    """Greedy word wrap (textwrap.wrap subset): whitespace-separated words, over-long words split."""
+    if len(text) <= width and '\n' not in text and '\t' not in text:
+        return [text] if text.strip() else []
+
+    lines = []
+    current = ""
+    for word in text.split():
+        while len(word) > width:
+            # Break words longer than a full line, like textwrap's break_long_words
+            room = width - len(current) - 1 if current else width
+            if room <= 0:
+                lines.append(current)
+                current = ""
+                continue
+            chunk, word = word[:room], word[room:]
+            current = f"{current} {chunk}" if current else chunk
+            lines.append(current)
+            current = ""
+        if not word:
+            continue
+        if not current:
+            current = word
+        elif len(current) + 1 + len(word) <= width:
+            current += " " + word
+        else:
+            lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return lines
+
 def render_sketchy_box(title, items, color=CYAN):
+    """Returns the phase box as one string; render_pipeline writes it."""
     MAX_WIDTH = 70
 
-    # Wrap text for items
+    # Wrap text for items, tracking the widest line as we go
     wrapped_lines = []
+    content_width = len(title)
     for item in items:
-        lines = textwrap.wrap(item, width=MAX_WIDTH)
+        lines = _hard_wrap(item, MAX_WIDTH)
         for i, line in enumerate(lines):
-            if i == 0:
-                wrapped_lines.append(f"• {line}")
-            else:
-                wrapped_lines.append(f"  {line}")
-
-    # Calculate box width
-    if wrapped_lines:
-        content_width = max([len(line) for line in wrapped_lines] + [len(title)]) + 2
-    else:
-        content_width = len(title) + 2
+            formatted = f"• {line}" if i == 0 else f"  {line}"
+            content_width = max(content_width, len(formatted))
+            wrapped_lines.append(formatted)
 
-    content_width = max(content_width, 40)
+    content_width = max(content_width + 2, 40)
     box_width = content_width + 4
 
     # Render
-    print(f"   {GREY}_{'_' * box_width}_{RESET}")
-    print(f"  {GREY}/{' ' * box_width}\\{RESET}")
-    print(f" {GREY}|{RESET}  {color}{title.center(box_width)}{RESET}  {GREY}|{RESET}")
-    print(f" {GREY}|{RESET}  {GREY}{'-' * box_width}{RESET}  {GREY}|{RESET}")
-
+    blank = ' ' * box_width
+    out = [
+        f"   {GREY}_{'_' * box_width}_{RESET}",
+        f"  {GREY}/{blank}\\{RESET}",
+        f" {GREY}|{RESET}  {color}{title.center(box_width)}{RESET}  {GREY}|{RESET}",
+        f" {GREY}|{RESET}  {GREY}{'-' * box_width}{RESET}  {GREY}|{RESET}",
+    ]
+
+    line_width = box_width - 2
     for line in wrapped_lines:
-        padding = box_width - len(line) - 2
-        print(f" {GREY}|{RESET}  {WHITE}{line}{RESET}{' ' * padding}  {GREY}|{RESET}")
+        out.append(f" {GREY}|{RESET}  {WHITE}{line:<{line_width}}{RESET}  {GREY}|{RESET}")
+
+    out.append(f"  {GREY}\\{'_' * box_width}/{RESET}")
+    out.append(f"          {GREY}|{RESET}")
+    out.append(f"          {GREY}v{RESET}")
+    return "\n".join(out)
 
-    print(f"  {GREY}\\{'_' * box_width}/{RESET}")
-    print(f"          {GREY}|{RESET}")
-    print(f"          {GREY}v{RESET}")
+# Rendered workflow pipeline, keyed by (path, mtime) of the workflow file
+_PIPELINE_CACHE = {"key": None, "text": None}
 
 def render_pipeline():
-    if not os.path.exists(WORKFLOW_PATH):
+    try:
+        key = (WORKFLOW_PATH, os.stat(WORKFLOW_PATH).st_mtime_ns)
+    except OSError:
         print(f"{RED}Error: Workflow file not found at {WORKFLOW_PATH}{RESET}")
         return
 
-    print(f"\n{BLUE}🚀 Initializing Programmer Mode...{RESET}")
-    print("-----------------------------------------------------")
-
-    with open(WORKFLOW_PATH, 'r') as f:
-        lines = f.readlines()
+    if _PIPELINE_CACHE["key"] == key:
+        sys.stdout.write(_PIPELINE_CACHE["text"])
+        return
 
     current_phase = None
     items = []
 
-    print(f"\n{MAGENTA}   ( Start ) {RESET}")
-    print(f"       {GREY}|{RESET}")
-    print(f"       {GREY}v{RESET}")
+    # Collected and written once
+    output = [
+        f"\n{BLUE}🚀 Initializing Programmer Mode...{RESET}",
+        "-----------------------------------------------------",
+        f"\n{MAGENTA}   ( Start ) {RESET}",
+        f"       {GREY}|{RESET}",
+        f"       {GREY}v{RESET}",
+    ]
 
     colors = [CYAN, BLUE, YELLOW, GREEN]
     color_idx = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line: continue
+    # One read; blank lines are dropped by filter() before the loop sees them
+    with open(WORKFLOW_PATH, 'r', encoding='utf-8') as f:
+        raw = f.read()
 
-        if line.startswith("## Phase"):
+    for s in filter(None, (l.strip() for l in raw.splitlines())):
+        if s.startswith("## Phase"):
             if current_phase:
-                render_sketchy_box(current_phase, items, colors[color_idx % len(colors)])
+                output.append(render_sketchy_box(current_phase, items, colors[color_idx % len(colors)]))
                 color_idx += 1
                 items = []
-            current_phase = line.replace("#", "").strip()
-        elif line.startswith("1. ") or line.startswith("- "):
-            clean_item = re.sub(r'^\d+\.\s*|-\s*', '', line)
-            clean_item = re.sub(r'\*\*(.*?)\*\*', r'\1', clean_item)
-            clean_item = re.sub(r'\*(.*?)\*', r'\1', clean_item)
+            current_phase = s.replace("#", "").strip()
+        elif s.startswith(("1. ", "- ")):
+            clean_item = _RE_LIST_PREFIX.sub('', s)
+            clean_item = _RE_BOLD.sub(r'\1', clean_item)
+            clean_item = _RE_ITAL.sub(r'\1', clean_item)
             if current_phase:
                 items.append(clean_item)
 
     if current_phase:
-        render_sketchy_box(current_phase, items, colors[color_idx % len(colors)])
+        output.append(render_sketchy_box(current_phase, items, colors[color_idx % len(colors)]))
 
-    print(f"\n{GREEN}    ( Done ) {RESET}\n")
-    print("-----------------------------------------------------")
-    print(f"{YELLOW}Protocol Loaded.{RESET} Ready for instructions.")
+    output.append(f"\n{GREEN}    ( Done ) {RESET}\n")
+    output.append("-----------------------------------------------------")
+    output.append(f"{YELLOW}Protocol Loaded.{RESET} Ready for instructions.")
+    text = "\n".join(output) + "\n"
+    _PIPELINE_CACHE["key"] = key
+    _PIPELINE_CACHE["text"] = text
+    sys.stdout.write(text)
 
 # ==========================================
 # SKILL MANAGEMENT LOGIC
 # ==========================================
+# Folders never scanned for skills
+INDEX_SKIP_DIRS = (".git", "__pycache__")
+
+def _dump_json_atomic(path, data, **kwargs):
+    """Compact json.dump into a temp file beside path, then swapped in: Ctrl-C never leaves a truncated cache."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'), **kwargs)
+    os.replace(tmp_path, path)
+
+def _build_index(lib_path):
+    """Walks the library once. Returns [[rel_dir, dir_mtime_ns, files], ...] in os.walk order."""
+    entries = []
+
+    def _scan(path, rel_dir):
+        # DirEntry caches the file type from the directory read, so no extra stat per entry
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                children = list(it)
+        except OSError:
+            return
+        files = [e.name for e in children if not e.is_dir()]
+        entries.append([rel_dir, mtime, files])
+        for e in children:
+            if e.is_dir(follow_symlinks=False) and e.name not in INDEX_SKIP_DIRS:
+                _scan(e.path, e.name if rel_dir == "." else os.path.join(rel_dir, e.name))
+
+    _scan(lib_path, ".")
+    return entries
+
+def _index_is_fresh(lib_path, entries):
+    """A folder's mtime changes whenever an entry is added/removed/renamed inside it."""
+    for rel_dir, mtime, _ in entries:
+        try:
+            if os.stat(os.path.join(lib_path, rel_dir)).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+# lib_path -> entries already loaded by this process (still re-validated against folder mtimes)
+_INDEX_MEMO = {}
+
+def _load_index(lib_path):
+    """Returns the cached directory listing of lib_path, re-walking only when a folder changed."""
+    entries = _INDEX_MEMO.get(lib_path)
+    if entries and _index_is_fresh(lib_path, entries):
+        return entries
+
+    try:
+        with open(SKILL_INDEX_PATH, 'r') as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        index = {}
+
+    entries = index.get(lib_path)
+    if entries and _index_is_fresh(lib_path, entries):
+        _INDEX_MEMO[lib_path] = entries
+        return entries
+
+    # A missing library needs no separate exists() gate: scandir fails and yields no entries
+    entries = _build_index(lib_path)
+    if not entries:
+        return entries
+    _INDEX_MEMO[lib_path] = entries
+    index[lib_path] = entries
+    try:
+        _dump_json_atomic(SKILL_INDEX_PATH, index)
+    except OSError:
+        pass # Index is only an accelerator
+    return entries
+
+def _invalidate_index(lib_path):
+    """Drops lib_path's cached listing so the next lookup re-walks it (e.g. after a git pull)."""
+    _INDEX_MEMO.pop(lib_path, None)
+    try:
+        with open(SKILL_INDEX_PATH, 'r') as f:
+            index = json.load(f)
+        if index.pop(lib_path, None) is not None:
+            _dump_json_atomic(SKILL_INDEX_PATH, index)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+def _iter_skill_dirs(lib_path):
+    """Yields (root, files) for every indexed folder of the library, like os.walk without dirs."""
+    for rel_dir, _, files in _load_index(lib_path):
+        root = lib_path if rel_dir == "." else os.path.join(lib_path, rel_dir)
+        yield root, files
+
 def list_skills():
     lib_path = get_active_library_path()
     persona = get_current_persona_name()
@@ -1102,10 +1511,7 @@ def list_skills():
         return
 
     skills_count = 0
-    for root, dirs, files in os.walk(lib_path):
-        # Prune .git and __pycache__ from traversal
-        dirs[:] = [d for d in dirs if d not in [".git", "__pycache__"]]
-
+    for root, files in _iter_skill_dirs(lib_path):
         level = root.replace(lib_path, '').count(os.sep)
         indent = ' ' * 4 * (level)
         subindent = ' ' * 4 * (level + 1)
@@ -1135,18 +1541,21 @@ def search_skills(query):
     print("-----------------------------------------------------")
 
     matches = []
+    seen = set()
+    query_lower = query.lower()
 
-    for root, dirs, files in os.walk(lib_path):
+    for root, files in _iter_skill_dirs(lib_path):
+        prefix = os.path.join(root, "")
         for f in files:
             if f.endswith(".md"):
-                path = os.path.join(root, f)
+                path = prefix + f
+                seen.add(path)
                 try:
-                    with open(path, 'r') as file_content:
-                        content = file_content.read()
-                        if query.lower() in content.lower():
-                            matches.append(path)
+                    if query_lower in _read_skill_text(path):
+                        matches.append(path)
                 except Exception:
                     continue
+    _save_search_cache(seen)
 
     if matches:
         for match in matches:
@@ -1157,41 +1566,80 @@ def search_skills(query):
          print(f"{YELLOW}No matches found.{RESET}")
     print("-----------------------------------------------------")
 
+# path -> [mtime_ns, lowercased content] for the active library's skills, shared by every search in this process
+_SEARCH_CACHE = {"data": None, "dirty": False}
+
+def _read_skill_text(path):
+    """Returns the lowercased content of a skill file, re-reading it only when its mtime changed."""
+    if _SEARCH_CACHE["data"] is None:
+        try:
+            with open(SEARCH_CACHE_PATH, 'r') as f:
+                _SEARCH_CACHE["data"] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            _SEARCH_CACHE["data"] = {}
+
+    cache = _SEARCH_CACHE["data"]
+    mtime = os.stat(path).st_mtime_ns
+    cached = cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r') as f:
+        text = f.read().lower()
+    cache[path] = [mtime, text]
+    _SEARCH_CACHE["dirty"] = True
+    return text
+
+def _save_search_cache(seen):
+    """Persists the cache, keeping only the paths seen in this search's walk."""
+    cache = _SEARCH_CACHE["data"] or {}
+    if len(cache) != len(seen) or not seen.issuperset(cache):
+        # Deleted, renamed and other-persona skills would otherwise pile up forever
+        _SEARCH_CACHE["data"] = {p: cache[p] for p in seen if p in cache}
+        _SEARCH_CACHE["dirty"] = True
+    if not _SEARCH_CACHE["dirty"]:
+        return
+    try:
+        _dump_json_atomic(SEARCH_CACHE_PATH, _SEARCH_CACHE["data"])
+        _SEARCH_CACHE["dirty"] = False
+    except OSError:
+        pass # Cache is only an accelerator
+
+def _find_skill(lib_path, name_query):
+    """Single-pass lookup: returns the first exact filename match, else the first fuzzy .md match."""
+    exact_names = (name_query, f"{name_query}.md")
+    query_lower = name_query.lower()
+    fuzzy = None
+
+    # Matches against the cached index, so no directory is re-read
+    for root, files in _iter_skill_dirs(lib_path):
+        for f in files:
+            if f in exact_names:
+                return os.path.join(root, f)
+            if fuzzy is None and f.endswith(".md") and query_lower in f.lower():
+                fuzzy = os.path.join(root, f)
+
+    return fuzzy
+
 def open_skill(name_query):
+    import subprocess
     lib_path = get_active_library_path()
 
-    # Find the skill file by fuzzy name match
-    target_file = None
-
-    # Direct match first
-    for root, dirs, files in os.walk(lib_path):
-        for f in files:
-             if f == name_query or f == f"{name_query}.md":
-                 target_file = os.path.join(root, f)
-                 break
-        if target_file: break
-
-    # Fuzzy match if no direct match
-    if not target_file:
-         for root, dirs, files in os.walk(lib_path):
-            for f in files:
-                if name_query.lower() in f.lower() and f.endswith(".md"):
-                     target_file = os.path.join(root, f)
-                     break
-            if target_file: break
+    # Find the skill file (direct match first, fuzzy otherwise)
+    target_file = _find_skill(lib_path, name_query)
 
     if target_file:
         print(f"{GREEN}Opening {target_file}...{RESET}")
 
         # Determine editor
-        editor = os.environ.get('EDITOR', 'open')
+        editor = _default_editor()
         # Check if 'code' is available
-        if shutil.which('code'):
+        if _which('code'):
             editor = 'code'
 
         try:
              subprocess.call([editor, target_file])
-        except Exception as e:
+        except OSError as e:
              print(f"{RED}Failed to open: {e}{RESET}")
              # Fallback
              subprocess.call(['open', target_file])
@@ -1202,25 +1650,8 @@ def open_skill(name_query):
 def delete_skill(name_query):
     lib_path = get_active_library_path()
 
-    # Find the skill file by fuzzy name match
-    target_file = None
-
-    # Direct match first
-    for root, dirs, files in os.walk(lib_path):
-        for f in files:
-             if f == name_query or f == f"{name_query}.md":
-                 target_file = os.path.join(root, f)
-                 break
-        if target_file: break
-
-    # Fuzzy match if no direct match
-    if not target_file:
-         for root, dirs, files in os.walk(lib_path):
-            for f in files:
-                if name_query.lower() in f.lower() and f.endswith(".md"):
-                     target_file = os.path.join(root, f)
-                     break
-            if target_file: break
+    # Find the skill file (direct match first, fuzzy otherwise)
+    target_file = _find_skill(lib_path, name_query)
 
     if target_file:
         print(f"{RED}WARNING: You are about to DELETE:{RESET}")
@@ -1247,11 +1678,13 @@ def get_skill_metadata(file_path):
             # Regex to pull the title from the metadata header (GitHub formatted)
             match = re.search(r'^title:\s*(.*)$', content, re.MULTILINE)
             return match.group(1).strip() if match else None
-    except:
+    except (OSError, UnicodeDecodeError):
         return None
 
 def backup_skill(file_path):
     """Atomic Backup: Moves file to ~/.jaavis/backups/"""
+    import shutil
+    from datetime import datetime
     if not os.path.exists(file_path): return
 
     backup_dir = os.path.join(JAAVIS_HOME, "backups")
@@ -1265,7 +1698,21 @@ def backup_skill(file_path):
     shutil.copy2(file_path, backup_path)
     return backup_path
 
+@lru_cache(maxsize=1)
+def _load_template():
+    """Reads the skill template once per process."""
+    with open(_template_path(), 'r') as t:
+        return t.read()
+
+def _fill(template, mapping):
+    """Replaces each placeholder in order (later values may contain earlier placeholders' text)."""
+    for placeholder, value in mapping.items():
+        template = template.replace(placeholder, value)
+    return template
+
 def harvest_skill(doc_path=None):
+    import shutil
+    import subprocess
     lib_path = get_active_library_path()
     print(f"{MAGENTA}🌾 Jaavis Harvest Protocol ({get_current_persona_name()}){RESET}")
     print("-----------------------------------------------------")
@@ -1335,12 +1782,13 @@ def harvest_skill(doc_path=None):
 
     # Template might still be in default or dynamic?
     # For now assume template is in default
-    if not os.path.exists(TEMPLATE_PATH):
+    template_path = _template_path()
+    if not os.path.exists(template_path):
         # Auto-create Default Template
-        print(f"{YELLOW}⚠️  Template not found. Creating default at {TEMPLATE_PATH}...{RESET}")
+        print(f"{YELLOW}⚠️  Template not found. Creating default at {template_path}...{RESET}")
         try:
-            os.makedirs(os.path.dirname(TEMPLATE_PATH), exist_ok=True)
-            with open(TEMPLATE_PATH, 'w') as f:
+            os.makedirs(os.path.dirname(template_path), exist_ok=True)
+            with open(template_path, 'w') as f:
                 f.write("""---
 tags: [tag1, tag2]
 grade: [Grade]
@@ -1363,7 +1811,7 @@ grade: [Grade]
 ```
 """)
             print(f"{GREEN}✔ Default template created.{RESET}")
-        except Exception as e:
+        except OSError as e:
             print(f"{RED}Error creating template: {e}{RESET}")
             return
 
@@ -1423,25 +1871,23 @@ grade: [Grade]
             os.makedirs(target_dir)
 
         # 3. Create File from Template
-        with open(TEMPLATE_PATH, 'r') as t:
-            template_content = t.read()
-
-        # Simple replacement of placeholders
-        new_content = template_content.replace("[Skill Name]", skill_name)
-        new_content = new_content.replace("[e.g. Backend, UI, DevOps]", domain)
-        new_content = new_content.replace("[Description]", description)
-        new_content = new_content.replace("[Grade]", grade)
-
         pros_list = "\n".join([f"  - \"{p.strip()}\"" for p in pros_input.split(",") if p.strip()]) if pros_input else "  - \"Standard Solution\""
         cons_list = "\n".join([f"  - \"{c.strip()}\"" for c in cons_input.split(",") if c.strip()]) if cons_input else "  - \"None identified\""
 
-        new_content = new_content.replace("[Pros List]", pros_list)
-        new_content = new_content.replace("[Cons List]", cons_list)
-
-
+        # Simple replacement of placeholders (applied in this order)
+        placeholders = {
+            "[Skill Name]": skill_name,
+            "[e.g. Backend, UI, DevOps]": domain,
+            "[Description]": description,
+            "[Grade]": grade,
+            "[Pros List]": pros_list,
+            "[Cons List]": cons_list,
+        }
         snippet = defaults.get("snippet", "")
         if snippet:
-             new_content = new_content.replace("(Paste your code snippet here)", snippet)
+            placeholders["(Paste your code snippet here)"] = snippet
+
+        new_content = _fill(_load_template(), placeholders)
 
         if os.path.exists(target_path):
             overwrite = input(f"{YELLOW}! Skill '{filename}' exists. Overwrite? (y/N): {RESET}")
@@ -1464,10 +1910,8 @@ grade: [Grade]
 
         choice = input(f"{CYAN}Select [1]: {RESET}").strip().lower()
 
-        import subprocess
-        import shutil
         if choice == '' or choice == '1':
-             if shutil.which('code'):
+             if _which('code'):
                  subprocess.call(['code', target_path])
              elif sys.platform == 'darwin':
                  # Fallback to 'open' on macOS which usually opens default editor (VS Code)
@@ -1484,18 +1928,164 @@ grade: [Grade]
 # ==========================================
 # MERGE LOGIC (Blueprint)
 # ==========================================
+# path -> [mtime_ns, size, frontmatter], persisted to SKILL_META_PATH at exit
+_SKILL_META = {"data": None, "dirty": False}
+
+def _save_skill_meta():
+    if not _SKILL_META["dirty"]:
+        return
+    try:
+        _dump_json_atomic(SKILL_META_PATH, _SKILL_META["data"], default=str)
+        _SKILL_META["dirty"] = False
+    except OSError:
+        pass # Cache is only an accelerator
+
+def _skill_meta_cache():
+    """Loads the persisted frontmatter cache on first use."""
+    if _SKILL_META["data"] is None:
+        import atexit
+        try:
+            with open(SKILL_META_PATH, 'r') as f:
+                _SKILL_META["data"] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            _SKILL_META["data"] = {}
+        atexit.register(_save_skill_meta)
+    return _SKILL_META["data"]
+
+def _parse_skill_meta(path, st):
+    """Parses a skill's frontmatter and records it under the file's mtime/size."""
+    try:
+        meta = _read_frontmatter_only(path)
+    except Exception:
+        meta = None
+    if not isinstance(meta, dict):
+        meta = None
+    _SKILL_META["data"][path] = [st.st_mtime_ns, st.st_size, meta]
+    _SKILL_META["dirty"] = True
+    return meta
+
+# Below this many changed files, thread start-up costs more than it saves
+PARSE_POOL_THRESHOLD = 8
+
+def _join_field(value):
+    return ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+
+def _skill_table_row(skill_id, meta):
+    """Display strings for the merge comparison table (ID, Name, Description, Grade, Pros, Cons)."""
+    return (
+        skill_id,
+        str(meta.get('name', skill_id)),
+        str(meta.get('description', 'No description')),
+        str(meta.get('grade', '-')),
+        _join_field(meta.get('pros', '')),
+        _join_field(meta.get('cons', '')),
+    )
+
+def _load_all_skills(lib_path, all_skills):
+    """Adds {skill_id: meta} for every skill with frontmatter in lib_path. First one found wins."""
+    cache = _skill_meta_cache()
+    found = []   # [skill_id, path, meta] in walk order
+    stale = []   # (found item, stat) whose frontmatter must be re-parsed
+
+    for root, files in _iter_skill_dirs(lib_path):
+        prefix = os.path.join(root, "") # one join per folder, plain concatenation per file
+        for f in files:
+            if f.endswith(".md") and f != "TEMPLATE_SKILL.md":
+                skill_id = f.replace(".md", "")
+                if skill_id in all_skills:
+                    continue
+                path = prefix + f
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                cached = cache.get(path)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    found.append([skill_id, path, cached[2]])
+                else:
+                    item = [skill_id, path, None]
+                    found.append(item)
+                    stale.append((item, st))
+
+    def _parse(job):
+        item, st = job
+        item[2] = _parse_skill_meta(item[1], st)
+
+    # Reads overlap and libyaml releases the GIL, so a pool helps on cold or large libraries
+    if len(stale) >= PARSE_POOL_THRESHOLD:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            list(pool.map(_parse, stale))
+    else:
+        for job in stale:
+            _parse(job)
+
+    for skill_id, path, meta in found:
+        if meta and skill_id not in all_skills:
+            # Hand out a copy so callers never mutate the cached entry
+            entry = dict(meta, path=path)
+            # Derived lookup fields (never persisted): lowercased tags for O(1) membership
+            entry["_tags"] = frozenset(str(t).lower() for t in meta.get("tags") or ())
+            entry["_grade_key"] = str(meta.get("grade", "Z"))
+            entry["_row"] = _skill_table_row(skill_id, meta)
+            all_skills[skill_id] = entry
+    return all_skills
+
+def _pick(label, options):
+    """Compact select: options laid out in numbered columns, chosen with one prompt. Returns the index."""
+    r = _get_rich()
+
+    console = _get_console()
+    console.print(r.Columns([f"[cyan]{i:>2}[/cyan] {r.escape(str(opt))}" for i, opt in enumerate(options)], padding=(0, 3)))
+    choice = r.Prompt.ask(f"[bold]{label}[/bold] #", choices=[str(i) for i in range(len(options))], default="0", show_choices=False)
+    return int(choice)
+
+def _write_if_changed(path, content):
+    """Writes content only if the file differs, so its mtime (and tools caching on it) stay put."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    # Write beside the target and swap it in, so Ctrl-C never leaves a half-written file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+async def _run_prefixed(label, argv, cwd=None):
+    """Runs one setup command (no shell), echoing its combined output with a [label] prefix."""
+    import asyncio
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1 << 20,
+        )
+    except FileNotFoundError:
+        print(f"{GREY}[{label}]{RESET} {RED}{argv[0]}: command not found{RESET}")
+        return 127
+    async for raw in proc.stdout:
+        print(f"{GREY}[{label}]{RESET} {raw.decode(errors='replace').rstrip()}", flush=True)
+    return await proc.wait()
+
+async def _run_setup(steps):
+    """Runs independent (label, argv, cwd) setup steps concurrently. Returns their exit codes."""
+    import asyncio
+    return await asyncio.gather(*(_run_prefixed(label, argv, cwd) for label, argv, cwd in steps))
+
 def merge_skills():
     """Merge two skills (Frontend + Backend) into a unified blueprint"""
     try:
-        from rich.console import Console
-        from rich.prompt import Prompt
-        from rich.panel import Panel
-        from rich.table import Table
-        import json
-
-        console = Console()
-        console = Console()
-        console.print(Panel.fit("[bold magenta]🧬 Jaavis Blueprint Merge[/bold magenta]", border_style="magenta"))
+        r = _get_rich()
+
+        console = _get_console()
+        console.print(r.Panel.fit("[bold magenta]🧬 Jaavis Blueprint Merge[/bold magenta]", border_style="magenta"))
         console.print("[dim]Create a unified project from separate Frontend and Backend skills.[/dim]\n")
 
         # 0.5 Selection of Library Source
@@ -1513,7 +2103,7 @@ def merge_skills():
 
         lib_paths = []
         if choice.startswith("Active Persona"):
-            p_path = personas_dict.get(current_p, {}).get("path", DEFAULT_LIBRARY_PATH)
+            p_path = personas_dict.get(current_p, {}).get("path", get_default_library_path())
             lib_paths.append(p_path)
         elif choice == "All Combined":
             for p in personas_dict:
@@ -1525,12 +2115,14 @@ def merge_skills():
             if p_path: lib_paths.append(p_path)
 
         if not lib_paths:
-            lib_paths = [DEFAULT_LIBRARY_PATH]
+            lib_paths = [get_default_library_path()]
 
         # 0. Ensure Project Init
         if not os.path.exists(os.path.join(os.getcwd(), ".jaavisrc")):
             console.print("[yellow]Project not initialized. Running 'jaavis init' first...[/yellow]")
             init_project()
+        # Read once; updated below with the blueprint choice
+        local_config = load_config_local()
 
         # 1. Tech Stack Advisor (Comparison Table)
         console.print("\n[bold cyan]💡 Tech Stack Advisor[/bold cyan]")
@@ -1540,30 +2132,15 @@ def merge_skills():
         # Recursive Scan and Parse
         with console.status("[bold cyan]Scanning library for skills...") as status:
             for lib_path in lib_paths:
-                if not os.path.exists(lib_path): continue
-                for root, dirs, files in os.walk(lib_path):
-                    for f in files:
-                        if f.endswith(".md") and f != "TEMPLATE_SKILL.md":
-                            path = os.path.join(root, f)
-                            try:
-                                with open(path, 'r') as file:
-                                    content = file.read()
-                                    meta = parse_frontmatter(content)
-                                    if meta:
-                                        skill_id = f.replace(".md", "")
-                                        # Deduplicate by using first-found in priority or just combining
-                                        if skill_id not in all_skills:
-                                            all_skills[skill_id] = meta
-                                            all_skills[skill_id]['path'] = path
-                            except:
-                                continue
+                # Indexed walk; frontmatter is only re-parsed for files that changed
+                _load_all_skills(lib_path, all_skills)
 
         if not all_skills:
             console.print("[red]No skills with valid metadata found in library.[/red]")
             return
 
         # Display Comparison Table
-        table = Table(title="Available Skills", show_header=True, header_style="bold magenta", box=None)
+        table = r.Table(title="Available Skills", show_header=True, header_style="bold magenta", box=None)
         table.add_column("Skill ID", style="cyan")
         table.add_column("Name", style="green")
         table.add_column("Description", style="white")
@@ -1572,46 +2149,40 @@ def merge_skills():
         table.add_column("Cons", style="red")
 
         # Sort by Grade
-        for skill_id, meta in sorted(all_skills.items(), key=lambda item: str(item[1].get('grade', 'Z'))):
-            # Safe string conversion for all fields
-            skill_name = str(meta.get('name', skill_id))
-            skill_desc = str(meta.get('description', 'No description'))
-            skill_grade = str(meta.get('grade', '-'))
-            pros = ", ".join(meta.get('pros', [])) if isinstance(meta.get('pros'), list) else str(meta.get('pros', ''))
-            cons = ", ".join(meta.get('cons', [])) if isinstance(meta.get('cons'), list) else str(meta.get('cons', ''))
-
-            table.add_row(
-                skill_id,
-                skill_name,
-                skill_desc,
-                skill_grade,
-                pros,
-                cons
-            )
+        # Rows are pre-formatted at ingest (safe string conversion for all fields)
+        for skill_id, meta in sorted(all_skills.items(), key=lambda item: item[1]['_grade_key']):
+            table.add_row(*meta['_row'])
 
         console.print(table)
         console.print("\n")
 
+        # Partition by tags in one pass (tag sets are built at ingest)
+        frontend_options = []
+        backend_options = []
+        for sid, m in all_skills.items():
+            tags = m['_tags']
+            if 'frontend' in tags or 'ui' in tags:
+                frontend_options.append(sid)
+            if 'backend' in tags or 'api' in tags:
+                backend_options.append(sid)
+
         # 2. Select Frontend
         console.print("\n[bold cyan]1. Select Frontend Skill[/bold cyan]")
-        frontend_options = [sid for sid, m in all_skills.items() if 'frontend' in [t.lower() for t in m.get('tags', [])] or 'ui' in [t.lower() for t in m.get('tags', [])]]
 
         if not frontend_options:
             frontend_options = sorted(all_skills.keys())
 
-        idx = interactive_menu("Choose Frontend", frontend_options)
+        idx = _pick("Choose Frontend", frontend_options)
         frontend_choice = frontend_options[idx]
         console.print(f"[green]✔ Selected:[/green] {frontend_choice}")
 
         # 3. Select Backend
         console.print("\n[bold cyan]2. Select Backend Skill[/bold cyan]")
-        backend_options = [sid for sid, m in all_skills.items() if 'backend' in [t.lower() for t in m.get('tags', [])] or 'api' in [t.lower() for t in m.get('tags', [])]]
-
         if not backend_options:
             backend_options = sorted(all_skills.keys())
         backend_options.append("None (Frontend Only)")
 
-        idx = interactive_menu("Choose Backend", backend_options)
+        idx = _pick("Choose Backend", backend_options)
         if idx == len(backend_options) - 1:
             backend_choice = None
             console.print("[dim]Backend skipped.[/dim]")
@@ -1620,14 +2191,12 @@ def merge_skills():
             console.print(f"[green]✔ Selected:[/green] {backend_choice}")
 
         # 4. Update .jaavisrc (Blueprint Definition)
-        config = load_config_local()
-        config["type"] = "blueprint"
-        config["frontend"] = frontend_choice
+        local_config["type"] = "blueprint"
+        local_config["frontend"] = frontend_choice
         if backend_choice:
-            config["backend"] = backend_choice
+            local_config["backend"] = backend_choice
 
-        with open(".jaavisrc", "w") as f:
-            json.dump(config, f, indent=2)
+        save_config_local(local_config)
 
         # 5. Merge Execution (Apply Skills)
         console.print(f"\n[bold magenta]🚀 Merging Blueprint...[/bold magenta]")
@@ -1644,30 +2213,46 @@ def merge_skills():
         console.print("\n[green]Merge Sequence Completed.[/green]")
 
         # 6. Setup / Post-Install
-        if Prompt.ask("\nRun automated setup (npm install & build)?", choices=["y", "n"], default="y") == "y":
+        if r.Prompt.ask("\nRun automated setup (npm install & build)?", choices=["y", "n"], default="y") == "y":
             console.print("\n[bold yellow]⚙️  Running Setup...[/bold yellow]")
 
+            # Setup steps are independent (different folders/daemons): collect them, then run concurrently
+            setup_steps = []
+
+            # Stat each candidate once (apply_skill above is what creates them)
+            present = {p: os.path.exists(p) for p in (
+                "apps/web/package.json",
+                "apps/api/compose.yaml",
+                "apps/api/docker-compose.yml",
+                "docker-compose.yml",
+                "docker-compose.yaml",
+            )}
+
             # Frontend Setup
-            if os.path.exists("apps/web/package.json"):
+            if present["apps/web/package.json"]:
                 console.print("  • Frontend: Installing dependencies...")
-                # Run with live output instead of silent blocking
-                subprocess.run("cd apps/web && npm install", shell=True, executable='/bin/zsh')
+                setup_steps.append(("web", ["npm", "install"], "apps/web"))
 
             # Backend/Docker Setup
             backend_compose_file = None
-            if os.path.exists("apps/api/compose.yaml"):
+            if present["apps/api/compose.yaml"]:
                 backend_compose_file = "apps/api/compose.yaml"
-            elif os.path.exists("apps/api/docker-compose.yml"):
+            elif present["apps/api/docker-compose.yml"]:
                 backend_compose_file = "apps/api/docker-compose.yml"
 
             if backend_compose_file:
                 console.print(f"  • Docker: Linking backend ({backend_compose_file})...")
-                with open("docker-compose.yml", "w") as f:
-                    f.write(f"# One-Army Docker Compose\n# Root Orchestrator\ninclude:\n  - {backend_compose_file}\n")
+                _write_if_changed("docker-compose.yml", f"# One-Army Docker Compose\n# Root Orchestrator\ninclude:\n  - {backend_compose_file}\n")
+                present["docker-compose.yml"] = True
 
-            if os.path.exists("docker-compose.yml") or os.path.exists("docker-compose.yaml"):
+            if present["docker-compose.yml"] or present["docker-compose.yaml"]:
                 console.print("  • Docker: Building containers...")
-                subprocess.run("docker compose build", shell=True, executable='/bin/zsh')
+                setup_steps.append(("docker", ["docker", "compose", "build"], None))
+
+            if setup_steps:
+                import asyncio
+                # Live output, prefixed per step so the interleaved lines stay readable
+                asyncio.run(_run_setup(setup_steps))
 
             console.print("[green]✨ Blueprint Setup Complete![/green]")
 
@@ -1677,14 +2262,29 @@ def merge_skills():
 # ==========================================
 # CLI HELPERS
 # ==========================================
+# package.json for `jaavis init`, pre-serialized (same bytes as json.dump(..., indent=2))
+_PKG_TEMPLATE = """{
+  "name": "__NAME__",
+  "version": "1.0.0",
+  "scripts": {
+    "start": "echo 'Run start script'",
+    "build": "echo 'Run build script'",
+    "dev": "echo 'Run dev script'",
+    "test": "echo 'Tests Passed'",
+    "test:e2e": "echo 'E2E Tests Passed'",
+    "audit": "echo 'Security Audit Passed'"
+  },
+  "dependencies": {},
+  "devDependencies": {}
+}"""
+
 def init_project():
     """Scaffold One-Army Directory Structure & Config"""
+    from datetime import datetime
     try:
-        from rich.console import Console
-        from rich.prompt import Prompt
-        import json
+        r = _get_rich()
 
-        console = Console()
+        console = _get_console()
 
         structure = [
             "apps/web",
@@ -1699,8 +2299,15 @@ def init_project():
         # 1. Directory Structure
         for p in structure:
             path = os.path.join(os.getcwd(), p)
-            if not os.path.exists(path):
-                os.makedirs(path)
+            try:
+                os.mkdir(path)
+                created = True
+            except FileExistsError:
+                created = False
+            except FileNotFoundError:
+                os.makedirs(path) # Parent (e.g. apps/) missing on a fresh project
+                created = True
+            if created:
                 console.print(f"  [green]✔ Created:[/green] {p}")
             else:
                 console.print(f"  [yellow]• Exists:[/yellow]  {p}")
@@ -1717,22 +2324,9 @@ def init_project():
         # 3. Package.json (One-Army Scripts)
         pkg_path = os.path.join(os.getcwd(), "package.json")
         if not os.path.exists(pkg_path):
-            pkg_data = {
-                "name": os.path.basename(os.getcwd()),
-                "version": "1.0.0",
-                "scripts": {
-                    "start": "echo 'Run start script'",
-                    "build": "echo 'Run build script'",
-                    "dev": "echo 'Run dev script'",
-                    "test": "echo 'Tests Passed'",
-                    "test:e2e": "echo 'E2E Tests Passed'",
-                    "audit": "echo 'Security Audit Passed'"
-                },
-                "dependencies": {},
-                "devDependencies": {}
-            }
+            project_name = json.dumps(os.path.basename(os.getcwd()))[1:-1] # JSON-escaped, sans quotes
             with open(pkg_path, 'w') as f:
-                json.dump(pkg_data, f, indent=2)
+                f.write(_PKG_TEMPLATE.replace("__NAME__", project_name))
             console.print("  [green]✔ Created:[/green] package.json (with default scripts)")
         else:
             console.print("  [yellow]• Exists:[/yellow]  package.json")
@@ -1745,7 +2339,7 @@ def init_project():
         console.print("  [bold blue]B (Campaign)[/bold blue]: Balanced (Standard SaaS) [dim][Default][/dim]")
         console.print("  [bold red]A (Fortress)[/bold red]: Quality > Speed (Enterprise/Fintech)")
 
-        grade_choice = Prompt.ask("Choose Grade", choices=["A", "B", "C", "a", "b", "c"]).upper()
+        grade_choice = r.Prompt.ask("Choose Grade", choices=["A", "B", "C", "a", "b", "c"]).upper()
 
         config = {
             "grade": grade_choice,
@@ -1754,9 +2348,7 @@ def init_project():
         }
 
         # 4. Save .jaavisrc
-        config_path = os.path.join(os.getcwd(), ".jaavisrc")
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        save_config_local(config)
 
         console.print(f"  [green]✔ Saved:[/green] .jaavisrc (Grade {grade_choice})")
 
@@ -1804,71 +2396,113 @@ def init_project():
 
 def check_k8s_connection():
     """Checks if kubectl can connect to a running cluster"""
+    import subprocess
     try:
         # Silently check if the cluster is reachable (timeout to avoid hanging)
-        subprocess.check_output(["kubectl", "cluster-info"], stderr=subprocess.STDOUT, timeout=5)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        res = subprocess.run(["kubectl", "cluster-info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+        return res.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
-def check_system(full_scan=True):
+def _list_dir(path):
+    """{name: DirEntry} for one directory; empty if it is missing or unreadable."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+# Last check_system() result; reused for a few seconds within one run (same project folder)
+_SYSTEM_CACHE = {"ts": 0.0, "cwd": None, "val": None}
+SYSTEM_CACHE_TTL = 5 # seconds
+# Where a brew-installed jaavis lives (Apple Silicon, Intel, Linuxbrew)
+_BREW_CELLARS = ("/opt/homebrew/Cellar/jaavis", "/usr/local/Cellar/jaavis", "/home/linuxbrew/.linuxbrew/Cellar/jaavis")
+
+def check_system(full_scan=True, use_cache=True):
     """Performs system health checks. Returns a dict of results."""
+    cwd = os.getcwd()
+    if (use_cache and _SYSTEM_CACHE["val"] is not None and _SYSTEM_CACHE["cwd"] == cwd
+            and time.monotonic() - _SYSTEM_CACHE["ts"] < SYSTEM_CACHE_TTL):
+        return copy.deepcopy(_SYSTEM_CACHE["val"])
+
+    results = _run_system_checks(cwd)
+    _SYSTEM_CACHE.update(ts=time.monotonic(), cwd=cwd, val=copy.deepcopy(results))
+    return results
+
+def _run_system_checks(cwd):
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
     results = {
         "tools": {},
+        "optional_tools": {}, # Needed by some deploy grades only; never fails the check
         "config": {},
         "integrations": {},
         "installation": {},
         "all_passed": True
     }
 
-    # 0. Check Installation (Homebrew)
-    results["installation"]["Homebrew Managed"] = False
-    if shutil.which("brew"):
+    tools = ["git", "node", "npm"]
+    optional_tools = ["docker", "kubectl"]
+
+    def _brew_managed():
+        if any(os.path.isdir(p) for p in _BREW_CELLARS):
+            return True
+        if not _which("brew"):
+            return False
         try:
-            # Check if jaavis is in brew list
-            res = subprocess.run(["brew", "list", "--formula"], capture_output=True, text=True)
-            if "jaavis" in res.stdout:
-                results["installation"]["Homebrew Managed"] = True
-        except:
-            pass
+            # Non-standard prefix: ask brew itself
+            res = subprocess.run(["brew", "list", "--formula"], capture_output=True, text=True, timeout=3)
+            return "jaavis" in res.stdout
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+    # Probes are independent: wall time is the slowest one, not the sum
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        brew_probe = pool.submit(_brew_managed)
+        found = dict(zip(tools + optional_tools, pool.map(_which, tools + optional_tools)))
+
+    # 0. Check Installation (Homebrew)
+    results["installation"]["Homebrew Managed"] = brew_probe.result()
 
     # Path of executable
     results["installation"]["Binary Path"] = sys.argv[0]
 
     # 1. Check Tools
-    tools = ["git", "node", "npm"]
     for tool in tools:
-        if shutil.which(tool):
+        if found[tool]:
             results["tools"][tool] = True
         else:
             results["tools"][tool] = False
             results["all_passed"] = False
+    for tool in optional_tools:
+        results["optional_tools"][tool] = bool(found[tool])
 
     # 2. Check Config
-    cwd = os.getcwd()
-    results["config"][".jaavisrc"] = os.path.exists(os.path.join(cwd, ".jaavisrc"))
-    results["config"][".env"] = os.path.exists(os.path.join(cwd, ".env"))
+    # One directory read answers every "does X exist in the project" question below
+    top = _list_dir(cwd)
+    results["config"][".jaavisrc"] = ".jaavisrc" in top
+    results["config"][".env"] = ".env" in top
 
     if not results["config"][".jaavisrc"]: results["all_passed"] = False
 
     # 3. Check Integrations (Links)
-    results["integrations"]["Vercel Linked"] = os.path.exists(os.path.join(cwd, ".vercel"))
-    results["integrations"]["Supabase Linked"] = os.path.exists(os.path.join(cwd, "supabase", "config.toml")) or os.path.exists(os.path.join(cwd, "supabase", "config.json")) # basic check
+    results["integrations"]["Vercel Linked"] = ".vercel" in top
+    supabase = _list_dir(os.path.join(cwd, "supabase")) if "supabase" in top else {}
+    results["integrations"]["Supabase Linked"] = "config.toml" in supabase or "config.json" in supabase # basic check
 
     # 4. Check Blueprint (Merge)
-    config_data = load_config_local() # Need to load local .jaavisrc
+    config_data = load_config_local() if results["config"][".jaavisrc"] else {} # Need to load local .jaavisrc
     if config_data.get("type") == "blueprint":
+        apps = _list_dir(os.path.join(cwd, "apps")) if "apps" in top else {}
         if "frontend" in config_data:
-            fe_path = os.path.join(cwd, "apps/web")
-            if not os.path.exists(fe_path):
+            if "web" not in apps:
                 results["integrations"]["Frontend (Blueprint)"] = False
                 results["all_passed"] = False
             else:
                  results["integrations"]["Frontend (Blueprint)"] = True
 
         if "backend" in config_data:
-             be_path = os.path.join(cwd, "apps/api")
-             if not os.path.exists(be_path):
+             if "api" not in apps:
                  results["integrations"]["Backend (Blueprint)"] = False
                  results["all_passed"] = False
              else:
@@ -1876,83 +2510,123 @@ def check_system(full_scan=True):
 
     return results
 
-def load_config_local():
-    """Load local .jaavisrc project config"""
+# Parsed .jaavisrc, keyed by (path, mtime, size) so a cd or an edit invalidates it
+_LOCAL_CONFIG_CACHE = {"key": None, "data": None}
+
+def _local_config_key(config_path):
+    # Single stat; raises OSError (e.g. FileNotFoundError) when there is no .jaavisrc
+    st = os.stat(config_path)
+    return (config_path, st.st_mtime_ns, st.st_size)
+
+def load_config_local(strict=False):
+    """Load local .jaavisrc project config. Missing/unreadable/malformed files read as {} unless
+    strict, which lets the OSError (FileNotFoundError when absent) or ValueError (bad JSON) through."""
     config_path = os.path.join(os.getcwd(), ".jaavisrc")
-    if os.path.exists(config_path):
+    try:
+        key = _local_config_key(config_path)
+    except OSError:
+        if strict: raise
+        return {}
+
+    if _LOCAL_CONFIG_CACHE["key"] != key:
+        orjson = _get_orjson()
         try:
-             with open(config_path, 'r') as f:
-                 return json.load(f)
-        except:
+             if orjson:
+                 with open(config_path, 'rb') as f:
+                     data = orjson.loads(f.read())
+             else:
+                 with open(config_path, 'r') as f:
+                     data = json.load(f)
+        except (OSError, ValueError): # JSONDecodeError (either flavour) is a ValueError
+             if strict: raise
              return {}
-    return {}
+        _LOCAL_CONFIG_CACHE["key"] = key
+        _LOCAL_CONFIG_CACHE["data"] = data
+
+    # Callers update the dict before saving it back
+    return copy.deepcopy(_LOCAL_CONFIG_CACHE["data"])
+
+def save_config_local(config):
+    """Save local .jaavisrc project config (left untouched when nothing changed)"""
+    config_path = os.path.join(os.getcwd(), ".jaavisrc")
+    _LOCAL_CONFIG_CACHE["key"] = None
+    orjson = _get_orjson()
+    if orjson:
+        content = orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+    else:
+        content = json.dumps(config, indent=2, ensure_ascii=False) # Raw UTF-8 like orjson, so the bytes match
+    changed = _write_if_changed(config_path, content)
+
+    # Keep the in-memory copy in sync so the next load_config_local() skips the disk
+    _LOCAL_CONFIG_CACHE["key"] = _local_config_key(config_path)
+    _LOCAL_CONFIG_CACHE["data"] = copy.deepcopy(config)
+    return changed
 
 def run_doctor():
     """CLI Command: Check system health"""
+    import subprocess
     try:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich import box
-        console = Console()
+        r = _get_rich()
+        console = _get_console()
 
         console.print("[bold cyan]🩺 Jaavis Doctor[/bold cyan]")
-        results = check_system()
+        results = check_system(use_cache=False) # Doctor always reports the live state
+
+        # Sections are collected and printed in one go (one measure/render pass)
+        sections = []
 
         # Installation Table
-        table = Table(show_header=False, box=None)
+        table = r.Table(show_header=False, box=None)
         table.add_column("Item")
         table.add_column("Status")
 
-        console.print("\n[bold]📦 Installation[/bold]")
         is_brew = results["installation"]["Homebrew Managed"]
         brew_status = "[green]Yes (Brew)[/green]" if is_brew else "[yellow]Manual Symlink[/yellow]"
         table.add_row("  Managed", brew_status)
         table.add_row("  Binary", f"[dim]{results['installation']['Binary Path']}[/dim]")
-        console.print(table)
+        sections += [r.Text.from_markup("\n[bold]📦 Installation[/bold]"), table]
 
         # Tools Table
-        table = Table(show_header=False, box=None)
+        table = r.Table(show_header=False, box=None)
         table.add_column("Item")
         table.add_column("Status")
 
-        console.print("\n[bold]🛠  Tools[/bold]")
         for tool, passed in results["tools"].items():
             icon = "[green]✔[/green]" if passed else "[red]✘[/red]"
             msg = f"[dim]Found[/dim]" if passed else "[red]Missing[/red]"
             table.add_row(f"  {tool}", f"{icon}  {msg}")
-        console.print(table)
+        sections += [r.Text.from_markup("\n[bold]🛠  Tools[/bold]"), table]
 
         # Config Table
-        table = Table(show_header=False, box=None)
+        table = r.Table(show_header=False, box=None)
         table.add_column("Item")
         table.add_column("Status")
 
-        console.print("\n[bold]📂 Configuration[/bold]")
         for conf, passed in results["config"].items():
             icon = "[green]✔[/green]" if passed else "[yellow]![/yellow]"
             msg = f"[dim]Present[/dim]" if passed else "[yellow]Missing[/yellow]"
             table.add_row(f"  {conf}", f"{icon}  {msg}")
-        console.print(table)
+        sections += [r.Text.from_markup("\n[bold]📂 Configuration[/bold]"), table]
 
         # Integrations
-        table = Table(show_header=False, box=None)
+        table = r.Table(show_header=False, box=None)
         table.add_column("Item")
         table.add_column("Status")
 
-        console.print("\n[bold]🔗 Integrations[/bold]")
         for integ, passed in results["integrations"].items():
             icon = "[green]✔[/green]" if passed else "[yellow]![/yellow]"
             msg = f"[dim]Linked[/dim]" if passed else "[yellow]Not Linked[/yellow]"
             table.add_row(f"  {integ}", f"{icon}  {msg}")
-        console.print(table)
+        sections += [r.Text.from_markup("\n[bold]🔗 Integrations[/bold]"), table]
+
+        console.print(r.Group(*sections))
 
         # Personas Integrity Check
         # Personas Integrity Check
 
-        p_table = Table(
+        p_table = r.Table(
             title="[bold cyan]Persona Status Report[/bold cyan]",
-            box=box.ROUNDED,
+            box=r.box.ROUNDED,
             border_style="blue",
             header_style="bold magenta",
             expand=True
@@ -1965,7 +2639,7 @@ def run_doctor():
         config = load_config()
         personas = config.get("personas", {})
         if "programmer" not in personas:
-             personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+             personas["programmer"] = {"path": get_default_library_path()}
 
         for name, p_data in personas.items():
             path = p_data.get("path", "")
@@ -1979,7 +2653,7 @@ def run_doctor():
                         remote_url = res.stdout.strip()
                     else:
                         remote_url = "[dim]No Remote[/dim]"
-                except:
+                except OSError:
                      remote_url = "[red]Error[/red]"
             elif not exists:
                 remote_url = "[bold red]MISSING[/bold red]"
@@ -1992,7 +2666,7 @@ def run_doctor():
 
             p_table.add_row(name, path, remote_url, status)
 
-        console.print(Panel(p_table, border_style="cyan", title="[bold]Jaavis Diagnostic[/bold]"))
+        console.print(r.Panel(p_table, border_style="cyan", title="[bold]Jaavis Diagnostic[/bold]"))
 
         # Recovery Hint for Missing Personas
         for name, p_data in personas.items():
@@ -2010,26 +2684,41 @@ def run_doctor():
     except ImportError:
         print("Rich not installed.")
 
+def _run_step(cmd):
+    """Runs one deploy command. Plain commands are exec'd directly; anything needing the shell
+    (pipes, globs, variables, builtins like cd) still goes through zsh."""
+    import shlex
+    import subprocess
+    if not _SHELL_META_RE.search(cmd):
+        try:
+            argv = shlex.split(cmd)
+        except ValueError:
+            argv = None
+        if argv:
+            try:
+                return subprocess.call(argv)
+            except OSError:
+                pass # Not on PATH, not executable, a directory...: let the shell resolve it and report
+    return subprocess.call(cmd, shell=True, executable='/bin/zsh')
+
 def deploy_project():
     """Execute Deployment Pipeline based on Grade (Glass Box & Harvestable)"""
+    import subprocess
     try:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.prompt import Prompt
-        import json
-        import subprocess
+        r = _get_rich()
 
-        console = Console()
+        console = _get_console()
         lib_path = get_active_library_path()
 
-        # 1. Read Config
-        config_path = os.path.join(os.getcwd(), ".jaavisrc")
-        if not os.path.exists(config_path):
+        # 1. Read Config (shared, cached loader; an empty {} falls through to the defaults)
+        try:
+            config = load_config_local(strict=True)
+        except FileNotFoundError:
             console.print("[bold red]❌ Error:[/bold red] .jaavisrc not found. Run 'jaavis init' first.")
             return
-
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        except ValueError as e:
+            console.print(f"[bold red]❌ Error:[/bold red] Could not parse .jaavisrc: {e}")
+            return
 
         grade = config.get("grade", "B")
         project_name = config.get("project_name", "Unknown")
@@ -2065,7 +2754,7 @@ def deploy_project():
         # 3. Strategy Selection
         console.print(f"\n[bold cyan]🚀 Deploying {project_name}[/bold cyan]")
 
-        table = Table(title="Available Deployment Strategies", show_header=True, header_style="bold magenta")
+        table = r.Table(title="Available Deployment Strategies", show_header=True, header_style="bold magenta")
         table.add_column("ID", style="cyan", width=4)
         table.add_column("Strategy", style="green")
         table.add_column("Grade", style="yellow")
@@ -2080,10 +2769,10 @@ def deploy_project():
 
         choice_idx = 0
         if len(strategies) > 1:
-            choice_str = Prompt.ask("Choose Strategy ID", default="1")
+            choice_str = r.Prompt.ask("Choose Strategy ID", default="1")
             try:
                 choice_idx = int(choice_str) - 1
-            except:
+            except ValueError:
                 choice_idx = 0
 
         selected_strategy = strategies[choice_idx] if 0 <= choice_idx < len(strategies) else strategies[0]
@@ -2100,12 +2789,12 @@ def deploy_project():
             issues = []
 
             # Grade B requires Docker
-            if grade == "B" and not shutil.which("docker"):
+            if grade == "B" and not health["optional_tools"]["docker"]:
                  issues.append("Docker not installed")
 
             # Grade A requires Kubectl
             if grade == "A":
-                if not shutil.which("kubectl"):
+                if not health["optional_tools"]["kubectl"]:
                      issues.append("Kubectl not installed")
                 elif not check_k8s_connection():
                      issues.append("Kubernetes Cluster Unreachable (Check Docker Desktop / Minikube)")
@@ -2122,7 +2811,7 @@ def deploy_project():
                 for issue in issues:
                     console.print(f"  - {issue}")
 
-                if not Prompt.ask("\n[bold yellow]Continue anyway?[/bold yellow]", choices=["y", "n"], default="n") == "y":
+                if not r.Prompt.ask("\n[bold yellow]Continue anyway?[/bold yellow]", choices=["y", "n"], default="n") == "y":
                     console.print("[red]Aborted.[/red]")
                     return
             else:
@@ -2199,8 +2888,7 @@ def deploy_project():
                 content = f.read()
 
             # Extract blocks
-            pattern = r'<!--\s*JAAVIS:EXEC\s*-->\s*```bash\n(.*?)\n```'
-            matches = re.findall(pattern, content, re.DOTALL)
+            matches = _EXEC_BLOCK_RE.findall(content)
 
             if not matches:
                 console.print("[yellow]⚠️  No execution blocks found in skill file.[/yellow]")
@@ -2228,7 +2916,7 @@ def deploy_project():
                     result = subprocess.run(tmp_path, shell=True, executable='/bin/zsh')
                     if result.returncode != 0:
                          console.print(f"[bold red]❌ Block {i+1} Failed (Exit Code {result.returncode})[/bold red]")
-                         if not Prompt.ask("Continue anyway?", choices=["y", "n"], default="n") == "y":
+                         if not r.Prompt.ask("Continue anyway?", choices=["y", "n"], default="n") == "y":
                              return
                 finally:
                     os.remove(tmp_path)
@@ -2237,7 +2925,7 @@ def deploy_project():
             return
 
         elif selected_strategy["type"] == "manual":
-            cmd = Prompt.ask("[bold yellow]Enter Command to Run[/bold yellow]")
+            cmd = r.Prompt.ask("[bold yellow]Enter Command to Run[/bold yellow]")
             steps = [("Manual Execution", cmd)]
 
         # 5. Glass Box Preview (Standard Only)
@@ -2246,7 +2934,7 @@ def deploy_project():
              return
 
         if selected_strategy["type"] == "standard":
-            table = Table(title="Preview", show_header=True, header_style="bold magenta")
+            table = r.Table(title="Preview", show_header=True, header_style="bold magenta")
             table.add_column("Step", style="cyan")
             table.add_column("Command", style="green")
 
@@ -2256,7 +2944,7 @@ def deploy_project():
             console.print(table)
 
             # 6. Execute / Harvest Prompt
-            action = Prompt.ask(
+            action = r.Prompt.ask(
                 "\n[bold yellow]? Ready to execute?[/bold yellow]",
                 choices=["Yes", "No", "Harvest"],
                 default="Yes"
@@ -2267,14 +2955,14 @@ def deploy_project():
                 return
 
             if action == "Harvest":
-                harvest_name = Prompt.ask("[cyan]Name this strategy (e.g. 'fast-deploy')[/cyan]")
+                harvest_name = r.Prompt.ask("[cyan]Name this strategy (e.g. 'fast-deploy')[/cyan]")
                 save_harvested_deploy(harvest_name, steps, lib_path)
                 console.print(f"[green]✔ Saved as '{harvest_name}'. Continuing execution...[/green]")
 
             # 7. Execution Loop (Standard)
             for title, cmd in steps:
                 console.print(f"\n[bold yellow]👉 {title}[/bold yellow]...")
-                result = subprocess.call(cmd, shell=True, executable='/bin/zsh')
+                result = _run_step(cmd)
                 if result != 0:
                     console.print(f"[bold red]❌ Failed at step: {title}[/bold red]")
                     return
@@ -2286,93 +2974,176 @@ def deploy_project():
 
 def parse_frontmatter(content):
     """Extracts YAML frontmatter from markdown content with native fallback if PyYAML is missing"""
-    content = content.strip()
+    # Slice out the block between the first two '---' instead of copying/splitting the whole file
+    content = content.lstrip()
     if not content.startswith("---"):
         return None
 
+    end = content.find("---", 3)
+    if end == -1:
+        return None
+
     try:
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return None
+        return _parse_yaml_block(content[3:end].strip())
+    except Exception as e:
+        return None
 
-        yaml_content = parts[1].strip()
+def _parse_yaml_block(yaml_content):
+    """Parses a frontmatter body with PyYAML, or a simple key: value subset if it is missing"""
+    # Try PyYAML if available (libyaml's C loader when it was built with it)
+    yaml = _get_yaml()
+    if yaml is not None:
+        return yaml.load(yaml_content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    # Native Fallback (Simple YAML subset: key: value)
+    meta = {}
+    for line in yaml_content.split("\n"):
+        if ":" in line:
+            key, val = line.split(":", 1)
+            key = key.strip()
+            val = val.strip()
+            # Handle basic lists [a, b] or simple strings
+            if val.startswith("[") and val.endswith("]"):
+                val = [i.strip().strip("'").strip('"') for i in val[1:-1].split(",")]
+            else:
+                val = val.strip("'").strip('"')
+            meta[key] = val
+    return meta
 
-        # Try PyYAML if available
-        try:
-            import yaml
-            return yaml.safe_load(yaml_content)
-        except ImportError:
-            # Native Fallback (Simple YAML subset: key: value)
-            meta = {}
-            for line in yaml_content.split("\n"):
-                if ":" in line:
-                    key, val = line.split(":", 1)
-                    key = key.strip()
-                    val = val.strip()
-                    # Handle basic lists [a, b] or simple strings
-                    if val.startswith("[") and val.endswith("]"):
-                        val = [i.strip().strip("'").strip('"') for i in val[1:-1].split(",")]
-                    else:
-                        val = val.strip("'").strip('"')
-                    meta[key] = val
-            return meta
-    except Exception as e:
+# Plain words YAML would turn into bools/None
+_YAML_SPECIAL_WORDS = frozenset(("yes", "no", "true", "false", "on", "off", "null"))
+
+def _fm_scalar(val, flow=False):
+    """Value of a quoted or plain scalar, or None when YAML might read it differently."""
+    if len(val) >= 2 and val[0] == val[-1] and val[0] in "\"'":
+        inner = val[1:-1]
+        return None if val[0] in inner or "\\" in inner else inner
+    if not val[0].isalpha() or ": " in val or " #" in val or "\t" in val or val.endswith(":"):
+        return None
+    if val.lower() in _YAML_SPECIAL_WORDS:
+        return None
+    if flow and any(c in val for c in "[]{}"):
         return None
+    return val
+
+def _parse_frontmatter_fast(lines):
+    """Regex parse of the common flat shape (name/description/grade, inline tags/pros/cons lists).
+    Returns None for anything else, so the caller falls back to full YAML."""
+    meta = {}
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        m = _RE_FM_SCALAR.fullmatch(line)
+        if m:
+            val = _fm_scalar(m.group(2))
+            if val is None:
+                return None
+            meta[m.group(1)] = val
+            continue
+        m = _RE_FM_LIST.fullmatch(line)
+        if not m:
+            return None
+        items = []
+        body = m.group(2).strip()
+        for item in (body.split(",") if body else ()):
+            item = item.strip()
+            val = _fm_scalar(item, flow=True) if item else None
+            if val is None:
+                return None
+            items.append(val)
+        meta[m.group(1)] = items
+    return meta or None
+
+# Frontmatter longer than this is treated as malformed
+FRONTMATTER_MAX_LINES = 200
+
+def _read_frontmatter_only(path):
+    """Streams a markdown file up to the closing '---' and parses just that block (body is never read)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                break
+        else:
+            return None
+        if line.strip() != "---":
+            return None
+
+        block = []
+        for line in f:
+            if line.rstrip() == "---":
+                meta = _parse_frontmatter_fast(block)
+                if meta is not None:
+                    return meta
+                try:
+                    return _parse_yaml_block("".join(block).strip())
+                except Exception:
+                    return None
+            block.append(line)
+            if len(block) > FRONTMATTER_MAX_LINES:
+                break
     return None
 
+# Title, description and first code block almost always sit near the top of a doc
+DOC_HEAD_CHARS = 4096
+
+def _doc_fields(content):
+    """(title, description, snippet) of a markdown text; '' for any that isn't found."""
+    title = description = snippet = ""
+
+    # 1 + 2. Title (H1) and Description in one pass, stopping once both are found
+    # Description heuristic: first non-empty, non-header, non-fence line
+    got_title = got_desc = False
+    for line in content.split('\n'):
+        l = line.strip()
+        if not got_title and l.startswith("# "):
+            title = l.replace("# ", "").strip()
+            got_title = True
+        elif not got_desc and l and not l.startswith("#") and not l.startswith("```"):
+            description = l
+            got_desc = True
+        if got_title and got_desc:
+            break
+
+    # 3. Code Snippet (First code block)
+    m = _MD_CODE_RE.search(content)
+    if m:
+        snippet = m.group(1).strip()
+
+    return title, description, snippet
+
 def parse_markdown_doc(doc_path):
     """Extract skill details from a markdown documentation file"""
     if not os.path.exists(doc_path):
         return None
 
     with open(doc_path, 'r') as f:
-        content = f.read()
+        head = f.read(DOC_HEAD_CHARS)
+        if len(head) < DOC_HEAD_CHARS:
+            fields = _doc_fields(head) # Whole file
+        else:
+            # Complete lines only; anything not found there means reading the rest
+            fields = _doc_fields(head[:head.rfind("\n") + 1])
+            if not all(fields):
+                f.seek(0)
+                fields = _doc_fields(f.read())
 
+    name, description, snippet = fields
     meta = {
-        "name": "",
-        "description": "",
-        "snippet": "",
+        "name": name,
+        "description": description,
+        "snippet": snippet,
         "grade": "B",
         "pros": "",
         "cons": ""
     }
 
-    lines = content.split('\n')
-
-    # 1. Title (H1)
-    for line in lines:
-        if line.strip().startswith("# "):
-            meta["name"] = line.strip().replace("# ", "").strip()
-            break
-
-    # 2. Description (First paragraph after title)
-    # Simple heuristic: look for first non-empty, non-header line
-    for line in lines:
-        l = line.strip()
-        if l and not l.startswith("#") and not l.startswith("```"):
-            meta["description"] = l
-            break
-
-    # 3. Code Snippet (First code block)
-    if "```" in content:
-        try:
-            start = content.find("```") + 3
-            # Skip language identifier if present
-            end_line = content.find("\n", start)
-            if end_line != -1:
-                start = end_line + 1
-
-            end = content.find("```", start)
-            if end != -1:
-                meta["snippet"] = content[start:end].strip()
-        except:
-            pass
-
     return meta
 
 def save_harvested_deploy(name, steps, lib_path):
     """Saves a deployment strategy as an executable skill"""
-    safe_name = re.sub(r'[^a-zA-Z0-9_-]', '', name).lower()
+    from datetime import datetime
+    safe_name = _SAFE_NAME_RE.sub('', name).lower()
     filename = f"deploy_{safe_name}.md"
     devops_dir = os.path.join(lib_path, "skills", "devops")
 
@@ -2398,29 +3169,19 @@ def save_harvested_deploy(name, steps, lib_path):
 
 def apply_skill(skill_name, dry_run=False, context=None):
     """Parses and executes bash blocks from a Skill File (Executable Knowledge)"""
+    import subprocess
     try:
-        from rich.console import Console
-        from rich.prompt import Prompt
-        from rich.panel import Panel
-        from rich.syntax import Syntax
-        import subprocess
-        import re
-
-        console = Console()
+        r = _get_rich()
+
+        console = _get_console()
         lib_path = get_active_library_path()
 
         # 1. Find the Skill File (Reuse logic from open_skill)
-        target_file = None
-        # Direct/Fuzzy Search
-        for root, dirs, files in os.walk(lib_path):
-            for f in files:
-                if f == skill_name or f == f"{skill_name}.md":
-                    target_file = os.path.join(root, f)
-                    break
-                if skill_name.lower() in f.lower() and f.endswith(".md"):
-                     target_file = os.path.join(root, f)
-                     break
-            if target_file: break
+        target_file = _find_skill(lib_path, skill_name)
+        if not target_file:
+            # Miss: rebuild the index once in case the library changed underneath it
+            _invalidate_index(lib_path)
+            target_file = _find_skill(lib_path, skill_name)
 
         if not target_file:
             console.print(f"[bold red]❌ Error:[/bold red] Skill '{skill_name}' not found.")
@@ -2432,10 +3193,8 @@ def apply_skill(skill_name, dry_run=False, context=None):
         with open(target_file, 'r') as f:
             content = f.read()
 
-        # Regex to find <!-- JAAVIS:EXEC --> followed by ```bash ... ```
-        # Handles multiline content inside the code block
-        pattern = r'<!--\s*JAAVIS:EXEC\s*-->\s*```bash\n(.*?)\n```'
-        matches = re.findall(pattern, content, re.DOTALL)
+        # Find <!-- JAAVIS:EXEC --> followed by ```bash ... ``` (multiline block content)
+        matches = _EXEC_BLOCK_RE.findall(content)
 
         if not matches:
             console.print("[yellow]⚠️  No key '<!-- JAAVIS:EXEC -->' executable blocks found in this skill.[/yellow]")
@@ -2443,24 +3202,28 @@ def apply_skill(skill_name, dry_run=False, context=None):
 
         console.print(f"[bold blue]🚀 Found {len(matches)} execution blocks.[/bold blue]")
 
+        # TEMPLATING: one {{key1|key2|...}} pattern, so each block is scanned once
+        placeholder_re = None
+        if context:
+            placeholder_re = re.compile(r'\{\{(' + '|'.join(map(re.escape, context)) + r')\}\}')
+
         # 3. Execution Loop
         for i, match in enumerate(matches, 1):
             cmd_block = match.strip()
 
-            # TEMPLATING: Replace placeholders
-            if context:
-                for key, val in context.items():
-                    cmd_block = cmd_block.replace(f"{{{{{key}}}}}", val)
+            # Replace placeholders
+            if placeholder_re:
+                cmd_block = placeholder_re.sub(lambda m: context[m.group(1)], cmd_block)
 
             console.print(f"\n[bold yellow]Block {i}/{len(matches)}:[/bold yellow]")
-            console.print(Panel(cmd_block, title="Script Content", border_style="blue"))
+            console.print(r.Panel(cmd_block, title="Script Content", border_style="blue"))
 
             if dry_run:
                 console.print("[dim](Dry Run: Skipped)[/dim]")
                 continue
 
             # Execute as a single script to preserve context (variables, if/else)
-            if Prompt.ask("Execute this block?", choices=["y", "n"], default="y") == "y":
+            if r.Prompt.ask("Execute this block?", choices=["y", "n"], default="y") == "y":
                 # Create a temporary script file to handle complex syntax
                 import tempfile
                 with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as tmp:
@@ -2478,7 +3241,7 @@ def apply_skill(skill_name, dry_run=False, context=None):
                         console.print(f"  [green]✔ Block {i} Success[/green]")
                     else:
                         console.print(f"[bold red]❌ Block {i} Failed (Exit Code {process.returncode})[/bold red]")
-                        if Prompt.ask("Continue anyway?", choices=["y", "n"], default="n") == "n":
+                        if r.Prompt.ask("Continue anyway?", choices=["y", "n"], default="n") == "n":
                             break
                 finally:
                     # Cleanup
@@ -2495,6 +3258,7 @@ def apply_skill(skill_name, dry_run=False, context=None):
 
 def link_remote_library(lib_path, remote_url):
     """Initializes git in the library folder and sets up the remote."""
+    import subprocess
     try:
         # Check if already a git repo
         if not os.path.exists(os.path.join(lib_path, ".git")):
@@ -2518,6 +3282,7 @@ def link_remote_library(lib_path, remote_url):
 
 def sync_skills():
     """CLI Command: Execute Git pull to sync skills."""
+    import subprocess
     lib_path = get_active_library_path()
     persona = get_current_persona_name()
 
@@ -2600,7 +3365,7 @@ def sync_skills():
     try:
         # Check for uncommitted changes
         status_output = subprocess.run(["git", "status", "--porcelain"], cwd=lib_path, capture_output=True, text=True).stdout.strip()
-    except:
+    except OSError:
         pass
 
     if status_output:
@@ -2635,8 +3400,11 @@ def sync_skills():
         print(f"{CYAN}Pulling latest updates...{RESET}")
         subprocess.run(["git", "fetch", "origin"], cwd=lib_path, check=True, capture_output=True)
 
-        status = subprocess.run(["git", "status", "-uno"], cwd=lib_path, capture_output=True, text=True).stdout
-        if "Your branch is up to date" in status:
+        up_to_date = _is_synced_with_upstream(lib_path)
+        if up_to_date is None:
+            status = subprocess.run(["git", "status", "-uno"], cwd=lib_path, capture_output=True, text=True).stdout
+            up_to_date = "Your branch is up to date" in status
+        if up_to_date:
             print(f"{GREEN}✔ Skills are already up to date.{RESET}")
             return
 
@@ -2645,6 +3413,7 @@ def sync_skills():
             result = subprocess.run(["git", "pull", "origin", "master"], cwd=lib_path, capture_output=True, text=True)
 
         if result.returncode == 0:
+            _invalidate_index(lib_path)
             print(f"{GREEN}✔ Sync complete!{RESET}")
             if result.stdout:
                 lines = result.stdout.split('\n')
@@ -2663,13 +3432,12 @@ def sync_skills():
 
 
     # Reset update flag after a successful sync attempt
-    config = load_config()
-    if "auto_sync" in config:
-        config["auto_sync"]["updates_pending"] = False
-        save_config(config)
+    _set_updates_pending(False)
 
 def push_library():
     """CLI Command: Push local library changes to remote (Auto-Init & Smart Sync)."""
+    import subprocess
+    from datetime import datetime
     lib_path = get_active_library_path()
     persona = get_current_persona_name()
 
@@ -2757,6 +3525,7 @@ APP_UPDATE_AVAILABLE = None # Stores latest version string if available
 
 def check_for_app_updates():
     """Checks GitHub for the latest CLI Release Tag"""
+    from datetime import datetime
     global APP_UPDATE_AVAILABLE
     config = load_config()
 
@@ -2767,12 +3536,11 @@ def check_for_app_updates():
             last_check_dt = datetime.fromisoformat(last_app_check)
             if (datetime.now() - last_check_dt).total_seconds() < 86400:
                 return
-        except:
+        except (ValueError, TypeError): # Corrupt timestamp: just check again
             pass
 
     try:
         import urllib.request
-        import json
 
         url = "https://api.github.com/repos/ponli550/JaavisCLI/tags"
         req = urllib.request.Request(url, headers={'User-Agent': 'JaavisCLI'})
@@ -2786,7 +3554,7 @@ def check_for_app_updates():
                 # If latest != current, assume update (naive but effective for now)
                 if latest_tag != VERSION:
                     APP_UPDATE_AVAILABLE = latest_tag
-    except:
+    except Exception: # Offline, rate-limited, unexpected payload... never block the CLI
         pass
 
     # Save Check Time
@@ -2794,8 +3562,94 @@ def check_for_app_updates():
     config["auto_sync"]["last_app_check"] = datetime.now().isoformat()
     save_config(config)
 
+def _set_updates_pending(pending):
+    """Records the skill-update flag as the presence of a sentinel file (no config rewrite)."""
+    try:
+        if pending:
+            os.makedirs(JAAVIS_HOME, exist_ok=True)
+            open(UPDATES_PENDING_PATH, 'w').close()
+        else:
+            os.unlink(UPDATES_PENDING_PATH)
+    except OSError:
+        pass # Already cleared, or ~/.jaavis not writable: only the banner is affected
+
+# A FETCH_HEAD younger than this means origin was fetched recently enough to compare against
+FETCH_FRESH_SECONDS = 3600
+
+def _has_origin_remote(lib_path):
+    """True if the library repo has an 'origin' remote. Reads .git/config instead of forking git."""
+    import configparser
+    git_config = configparser.ConfigParser(strict=False, allow_no_value=True, interpolation=None)
+    try:
+        if git_config.read(os.path.join(lib_path, ".git", "config")):
+            return git_config.has_section('remote "origin"')
+    except configparser.Error:
+        pass # Syntax configparser can't follow: let git answer
+    if not os.path.exists(os.path.join(lib_path, ".git")):
+        return False
+    # .git is a file (worktree/submodule) or its config is unusual: ask git itself
+    import subprocess
+    try:
+        result = subprocess.run(["git", "remote"], cwd=lib_path, capture_output=True, text=True)
+    except OSError:
+        return False
+    return "origin" in result.stdout.split()
+
+def _fetched_recently(lib_path):
+    try:
+        return time.time() - os.stat(os.path.join(lib_path, ".git", "FETCH_HEAD")).st_mtime < FETCH_FRESH_SECONDS
+    except OSError:
+        return False
+
+def _git_ref_sha(git_dir, ref):
+    """Commit a ref points at, from the loose ref file or packed-refs. None if neither has it."""
+    try:
+        with open(os.path.join(git_dir, ref), 'r') as f:
+            return f.read().strip()
+    except OSError:
+        pass
+    try:
+        with open(os.path.join(git_dir, "packed-refs"), 'r') as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+def _is_synced_with_upstream(lib_path):
+    """Whether the checked-out branch and its upstream are on the same commit, read straight from .git.
+    True/False when known; None when it takes git to tell (detached HEAD, no upstream, worktree...)."""
+    import configparser
+    git_dir = os.path.join(lib_path, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD"), 'r') as f:
+            head = f.read().strip()
+        git_config = configparser.ConfigParser(strict=False, interpolation=None)
+        git_config.read(os.path.join(git_dir, "config"))
+    except (OSError, configparser.Error):
+        return None
+    if not head.startswith("ref: refs/heads/"):
+        return None
+
+    branch_ref = head[len("ref: "):]
+    section = f'branch "{branch_ref[len("refs/heads/"):]}"'
+    remote = git_config.get(section, "remote", fallback=None)
+    merge = git_config.get(section, "merge", fallback=None)
+    if not remote or remote == "." or not merge or not merge.startswith("refs/heads/"):
+        return None
+
+    local_sha = _git_ref_sha(git_dir, branch_ref)
+    upstream_sha = _git_ref_sha(git_dir, f"refs/remotes/{remote}/{merge[len('refs/heads/'):]}")
+    if not local_sha or not upstream_sha:
+        return None
+    return local_sha == upstream_sha
+
 def check_for_skill_updates():
     """Background check for skill library updates (throttled to 24h)."""
+    import subprocess
+    from datetime import datetime
     global SKILL_UPDATES_AVAILABLE
     config = load_config()
 
@@ -2803,7 +3657,7 @@ def check_for_skill_updates():
     check_for_app_updates()
 
     # Check updates for CORE library (Programmer) only
-    lib_path = DEFAULT_LIBRARY_PATH
+    lib_path = get_default_library_path()
 
     # 1. Throttling Check
     last_check_str = config.get("auto_sync", {}).get("last_check")
@@ -2812,9 +3666,9 @@ def check_for_skill_updates():
             last_check = datetime.fromisoformat(last_check_str)
             if (datetime.now() - last_check).total_seconds() < 86400: # 24 Hours
                 # If we already knew there were updates, keep that state
-                SKILL_UPDATES_AVAILABLE = config.get("auto_sync", {}).get("updates_pending", False)
+                SKILL_UPDATES_AVAILABLE = os.path.exists(UPDATES_PENDING_PATH)
                 return
-        except:
+        except (ValueError, TypeError): # Corrupt timestamp: just check again
             pass
 
     # 2. Check for Git Remote
@@ -2823,54 +3677,72 @@ def check_for_skill_updates():
 
     try:
         # Check if origin remote exists
-        result = subprocess.run(["git", "remote"], cwd=lib_path, capture_output=True, text=True)
-        if "origin" not in result.stdout:
+        if not _has_origin_remote(lib_path):
              return
 
-        # Perform Fetch in background-ish (silent)
-        subprocess.run(["git", "fetch", "origin"], cwd=lib_path, capture_output=True, timeout=5)
-
-        # Compare HEAD with origin/main or origin/master
-        status = subprocess.run(["git", "status", "-uno"], cwd=lib_path, capture_output=True, text=True).stdout
+        # Perform Fetch in background-ish (silent), unless one already ran within the hour
+        if not _fetched_recently(lib_path):
+            subprocess.run(["git", "fetch", "origin"], cwd=lib_path, capture_output=True, timeout=5)
 
-        if "Your branch is behind" in status:
-            SKILL_UPDATES_AVAILABLE = True
-        else:
+        # Compare HEAD with its upstream; git only has to work out ahead vs behind when they differ
+        if _is_synced_with_upstream(lib_path):
             SKILL_UPDATES_AVAILABLE = False
+        else:
+            status = subprocess.run(["git", "status", "-uno"], cwd=lib_path, capture_output=True, text=True).stdout
+            SKILL_UPDATES_AVAILABLE = "Your branch is behind" in status
 
-        # 3. Update Config
+        # 3. Record the result; the config only changes when the 24h window rolls over
+        _set_updates_pending(SKILL_UPDATES_AVAILABLE)
         if "auto_sync" not in config: config["auto_sync"] = {}
         config["auto_sync"]["last_check"] = datetime.now().isoformat()
-        config["auto_sync"]["updates_pending"] = SKILL_UPDATES_AVAILABLE
+        config["auto_sync"].pop("updates_pending", None) # Superseded by the sentinel file
         save_config(config)
 
     except Exception:
         # Silently fail for background checks (no internet, git lock, etc)
         pass
 
+def _help_cache_key():
+    """Everything the rendered help screen depends on (this file, terminal, persona, banners)."""
+    import shutil
+    return [VERSION, os.stat(__file__).st_mtime_ns, shutil.get_terminal_size().columns, sys.stdout.isatty(),
+            get_current_persona_name(), APP_UPDATE_AVAILABLE, SKILL_UPDATES_AVAILABLE,
+            *(os.environ.get(v) for v in ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR"))]
+
 def print_help():
-    """Render Rich Help Menu"""
+    """Render Rich Help Menu (replayed from HELP_CACHE_PATH when nothing it depends on changed)"""
+    key = _help_cache_key()
+    try:
+        with open(HELP_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            sys.stdout.write(cached["text"])
+            sys.stdout.flush()
+            return
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass # Missing or unreadable cache: render live
+
     try:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
+        r = _get_rich()
+
+        console = _get_console()
 
-        console = Console()
+        parts = []
 
         # Update Banner (App)
         if APP_UPDATE_AVAILABLE:
-            console.print(f"\n[bold green]🚀 Jaavis Update Available: v{APP_UPDATE_AVAILABLE}[/bold green]")
-            console.print(f"[dim]Run 'brew upgrade jaavis' to update from v{VERSION}[/dim]")
+            parts.append(r.Text.from_markup(f"\n[bold green]🚀 Jaavis Update Available: v{APP_UPDATE_AVAILABLE}[/bold green]"))
+            parts.append(r.Text.from_markup(f"[dim]Run 'brew upgrade jaavis' to update from v{VERSION}[/dim]"))
 
         # Update Banner (Skills)
         if SKILL_UPDATES_AVAILABLE:
-            console.print("\n[bold yellow]🌟 New skill updates available! Run 'jaavis sync' to upgrade your knowledge.[/bold yellow]")
+            parts.append(r.Text.from_markup("\n[bold yellow]🌟 New skill updates available! Run 'jaavis sync' to upgrade your knowledge.[/bold yellow]"))
 
         # Header
-        console.print(Panel.fit("[bold cyan]🤖 JAAVIS CLI[/bold cyan] - One-Army Orchestrator", border_style="blue"))
-        console.print(f"[dim]Active Persona: {get_current_persona_name()}[/dim]")
+        parts.append(r.Panel.fit("[bold cyan]🤖 JAAVIS CLI[/bold cyan] - One-Army Orchestrator", border_style="blue"))
+        parts.append(r.Text.from_markup(f"[dim]Active Persona: {get_current_persona_name()}[/dim]"))
 
-        table = Table(show_header=True, header_style="bold magenta", box=None)
+        table = r.Table(show_header=True, header_style="bold magenta", box=None)
         table.add_column("Command", style="cyan", width=12)
         table.add_column("Alias", style="yellow", width=8)
         table.add_column("Description", style="white")
@@ -2892,8 +3764,19 @@ def print_help():
         table.add_row("init", "", "Scaffold new project structure")
         table.add_row("help", "", "Show this help screen")
 
-        console.print(table)
-        console.print("\n[grey50]Run 'jaavis <command> -h' for specific arguments.[/grey50]")
+        parts.append(table)
+        parts.append(r.Text.from_markup("\n[grey50]Run 'jaavis <command> -h' for specific arguments.[/grey50]"))
+        with console.capture() as capture:
+            console.print(r.Group(*parts))
+        text = capture.get()
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+        try:
+            os.makedirs(JAAVIS_HOME, exist_ok=True)
+            _write_if_changed(HELP_CACHE_PATH, json.dumps({"key": key, "text": text}))
+        except OSError:
+            pass # Cache is only an accelerator
 
     except ImportError:
         print("Rich not installed. Run 'pip install rich'")
@@ -2903,67 +3786,42 @@ VERSION = "1.1.8"
 # ==========================================
 # MAINTAINER
 # ==========================================
-def main():
-    parser = argparse.ArgumentParser(description="# Jaavis Core - The One-Army Orchestrator\n# Version: 1.0.0", add_help=False)
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Subcommands with Aliases
-    subparsers.add_parser("list", aliases=["ls"], help="List all harvested skills")
-
-    harvest_parser = subparsers.add_parser("harvest", aliases=["new"], help="Interactive skill extraction wizard")
-    harvest_parser.add_argument("--doc", help="Path to documentation file to auto-harvest from")
-    harvest_parser.add_argument("doc_flag", nargs='?', help="Positional path to doc (optional)")
-
-    # Search Command
-    search_parser = subparsers.add_parser("search", help="Search skills by content")
-    search_parser.add_argument("query", help="Keyword to search for")
-
-    # Open Command
-    open_parser = subparsers.add_parser("open", help="Open a skill in VS Code")
-    open_parser.add_argument("name", help="Name of the skill to open (fuzzy match)")
-
-    # Delete Command
-    delete_parser = subparsers.add_parser("delete", aliases=["rm"], help="Delete a skill")
-    delete_parser.add_argument("name", help="Name of the skill to delete")
-
-    # Code Command (New)
-    subparsers.add_parser("code", help="Open Jaavis Brain in VS Code")
-
-    # Manage Command (TUI)
-    subparsers.add_parser("manage", aliases=["tui"], help="Interactive TUI Manager")
-
-    # Persona Command
-    subparsers.add_parser("persona", aliases=["p"], help="Switch Persona")
-
-    # Init Command
-    subparsers.add_parser("init", help="Scaffold One-Army Project")
-
-    # Deploy Command
-    subparsers.add_parser("deploy", help="Deploy Project")
-
-    # Merge Command
-    subparsers.add_parser("merge", help="Merge Skills into Blueprint")
-
-    # Apply Command
-    apply_parser = subparsers.add_parser("apply", help="Apply Skill (Executable Knowledge)")
-    apply_parser.add_argument("name", help="Name of the skill to apply")
-    apply_parser.add_argument("--dry-run", action="store_true", help="Preview commands without running")
-
-    # Doctor Command
-    subparsers.add_parser("doctor", aliases=["chk", "check"], help="Check system health")
-
-    # Sync Command
-    subparsers.add_parser("sync", help="Sync skills with remote library")
-
-    # Push Command
-    subparsers.add_parser("push", help="Push skills to remote library")
-
-    # Brainstorm Command
-    subparsers.add_parser("brainstorm", aliases=["bs"], help="AI Refactor & Optimization")
-
-    # Help Command
-    subparsers.add_parser("help", help="Show help message")
+# name -> (aliases, help, arguments as (flags, kwargs)), in the order `jaavis` lists them
+SUBCOMMANDS = {
+    "list": (["ls"], "List all harvested skills", []),
+    "harvest": (["new"], "Interactive skill extraction wizard", [
+        (("--doc",), {"help": "Path to documentation file to auto-harvest from"}),
+        (("doc_flag",), {"nargs": '?', "help": "Positional path to doc (optional)"}),
+    ]),
+    "search": ([], "Search skills by content", [(("query",), {"help": "Keyword to search for"})]),
+    "open": ([], "Open a skill in VS Code", [(("name",), {"help": "Name of the skill to open (fuzzy match)"})]),
+    "delete": (["rm"], "Delete a skill", [(("name",), {"help": "Name of the skill to delete"})]),
+    "code": ([], "Open Jaavis Brain in VS Code", []),
+    "manage": (["tui"], "Interactive TUI Manager", []),
+    "persona": (["p"], "Switch Persona", []),
+    "init": ([], "Scaffold One-Army Project", []),
+    "deploy": ([], "Deploy Project", []),
+    "merge": ([], "Merge Skills into Blueprint", []),
+    "apply": ([], "Apply Skill (Executable Knowledge)", [
+        (("name",), {"help": "Name of the skill to apply"}),
+        (("--dry-run",), {"action": "store_true", "help": "Preview commands without running"}),
+    ]),
+    "doctor": (["chk", "check"], "Check system health", []),
+    "sync": ([], "Sync skills with remote library", []),
+    "push": ([], "Push skills to remote library", []),
+    "brainstorm": (["bs"], "AI Refactor & Optimization", []),
+    "help": ([], "Show help message", []),
+}
+_SUBCOMMAND_ALIASES = {alias: name for name, (aliases, _, _) in SUBCOMMANDS.items() for alias in [name, *aliases]}
+
+def _add_subcommand(subparsers, name):
+    aliases, help_text, arguments = SUBCOMMANDS[name]
+    sub = subparsers.add_parser(name, aliases=aliases, help=help_text)
+    for flags, kwargs in arguments:
+        sub.add_argument(*flags, **kwargs)
 
+def main():
+    import argparse
     try:
         # Parse args (handling aliases manually if argparse version < 3.8 issues, but aliases param works in recent python)
         # To catch 'jaavis' with no args, we check sys.argv
@@ -2993,6 +3851,14 @@ def main():
             print_help()
             return
 
+        # Only the subcommand being run gets a subparser; unknown input gets them all so
+        # argparse still reports the valid choices
+        parser = argparse.ArgumentParser(description="# Jaavis Core - The One-Army Orchestrator\n# Version: 1.0.0", add_help=False)
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+        wanted = _SUBCOMMAND_ALIASES.get(sys.argv[1])
+        for name in ([wanted] if wanted else SUBCOMMANDS):
+            _add_subcommand(subparsers, name)
+
         try:
             args = parser.parse_args()
         except argparse.ArgumentError:
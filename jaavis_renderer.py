@@ -14,83 +14,87 @@ GREY = '\033[0;90m'
 
 MAX_WIDTH = 70
 
+# Compiled once; parse_and_render applies them to every list line
+_RE_LIST_PREFIX = re.compile(r'^\d+\.\s*|-\s*')
+_RE_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_RE_ITAL = re.compile(r'\*(.*?)\*')
+
 def render_sketchy_box(title, items, color=CYAN):
-    # Wrap text for items
+    """Returns the phase box as one string; parse_and_render writes it."""
+    # Wrap text for items, tracking the widest line (or the title) as we go
     wrapped_lines = []
+    content_width = len(title)
     for item in items:
         # Initial wrap
         lines = textwrap.wrap(item, width=MAX_WIDTH)
         # Add bullet to first line, indent others
         for i, line in enumerate(lines):
-            if i == 0:
-                wrapped_lines.append(f"• {line}")
-            else:
-                wrapped_lines.append(f"  {line}")
-
-    # Calculate box width based on title or longest wrapped line
-    if wrapped_lines:
-        content_width = max([len(line) for line in wrapped_lines] + [len(title)]) + 2
-    else:
-        content_width = len(title) + 2
+            formatted = f"• {line}" if i == 0 else f"  {line}"
+            content_width = max(content_width, len(formatted))
+            wrapped_lines.append(formatted)
 
     # Ensure min width for aesthetic
-    content_width = max(content_width, 40)
+    content_width = max(content_width + 2, 40)
     box_width = content_width + 4
 
     # Sketchy Borders
-    print(f"   {GREY}_{'_' * box_width}_{RESET}")
-    print(f"  {GREY}/{' ' * box_width}\\{RESET}")
-    print(f" {GREY}|{RESET}  {color}{title.center(box_width)}{RESET}  {GREY}|{RESET}")
-    print(f" {GREY}|{RESET}  {GREY}{'-' * box_width}{RESET}  {GREY}|{RESET}")
+    out = [
+        f"   {GREY}_{'_' * box_width}_{RESET}",
+        f"  {GREY}/{' ' * box_width}\\{RESET}",
+        f" {GREY}|{RESET}  {color}{title.center(box_width)}{RESET}  {GREY}|{RESET}",
+        f" {GREY}|{RESET}  {GREY}{'-' * box_width}{RESET}  {GREY}|{RESET}",
+    ]
 
     for line in wrapped_lines:
         # Pad line to match box width
-        padding = box_width - len(line) - 2
-        print(f" {GREY}|{RESET}  {WHITE}{line}{RESET}{' ' * padding}  {GREY}|{RESET}")
+        out.append(f" {GREY}|{RESET}  {WHITE}{line:<{box_width - 2}}{RESET}  {GREY}|{RESET}")
 
-    print(f"  {GREY}\\{'_' * box_width}/{RESET}")
-    print(f"          {GREY}|{RESET}")
-    print(f"          {GREY}v{RESET}")
+    out.append(f"  {GREY}\\{'_' * box_width}/{RESET}")
+    out.append(f"          {GREY}|{RESET}")
+    out.append(f"          {GREY}v{RESET}")
+    return "\n".join(out)
 
 def parse_and_render(filepath):
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        raw = f.read()
 
     current_phase = None
     items = []
 
-    print(f"\n{MAGENTA}   ( Start ) {RESET}")
-    print(f"       {GREY}|{RESET}")
-    print(f"       {GREY}v{RESET}")
+    # Collected and written once
+    output = [
+        f"\n{MAGENTA}   ( Start ) {RESET}",
+        f"       {GREY}|{RESET}",
+        f"       {GREY}v{RESET}",
+    ]
 
     # cycling colors for phases
     colors = [CYAN, BLUE, YELLOW, GREEN]
     color_idx = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line: continue
-
+    # Blank lines are dropped by filter() before the loop sees them
+    for line in filter(None, (l.strip() for l in raw.splitlines())):
         if line.startswith("## Phase"):
             if current_phase:
-                render_sketchy_box(current_phase, items, colors[color_idx % len(colors)])
+                output.append(render_sketchy_box(current_phase, items, colors[color_idx % len(colors)]))
                 color_idx += 1
                 items = []
             current_phase = line.replace("#", "").strip()
         elif line.startswith("1. ") or line.startswith("- "):
              # Clean up the list item
-            clean_item = re.sub(r'^\d+\.\s*|-\s*', '', line)
-            clean_item = re.sub(r'\*\*(.*?)\*\*', r'\1', clean_item) # Remove bold stars but keep text
-            clean_item = re.sub(r'\*(.*?)\*', r'\1', clean_item)     # Remove italic stars but keep text
+            clean_item = _RE_LIST_PREFIX.sub('', line)
+            clean_item = _RE_BOLD.sub(r'\1', clean_item) # Remove bold stars but keep text
+            clean_item = _RE_ITAL.sub(r'\1', clean_item) # Remove italic stars but keep text
             if current_phase:
                 items.append(clean_item)
         elif current_phase and line[0].isalpha(): # Capture continuation lines/notes if strictly formatted
              pass
 
     if current_phase:
-        render_sketchy_box(current_phase, items, colors[color_idx % len(colors)])
+        output.append(render_sketchy_box(current_phase, items, colors[color_idx % len(colors)]))
 
-    print(f"\n{GREEN}    ( Done ) {RESET}\n")
+    output.append(f"\n{GREEN}    ( Done ) {RESET}\n")
+    sys.stdout.write("\n".join(output) + "\n")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2: